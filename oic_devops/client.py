@@ -8,7 +8,9 @@ import logging
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 from oic_devops.config import OICConfig
 from oic_devops.exceptions import (
@@ -22,6 +24,7 @@ from oic_devops.resources.libraries import LibrariesResource
 from oic_devops.resources.lookups import LookupsResource
 from oic_devops.resources.monitoring import MonitoringResource
 from oic_devops.resources.packages import PackagesResource
+from oic_devops.utils.serialization import loads
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -59,9 +62,23 @@ class OICClient:
 		self.config = OICConfig(config_file=config_file, profile=profile)
 		self.logger.info(f'Initialized OIC client with profile: {profile}')
 
-		# Prepare session
+		# Prepare session. All resources send their requests through it, and its
+		# connection pool is sized for workflows that issue requests from
+		# several threads at once. Transient gateway errors are retried on the
+		# pooled connections with backoff.
 		self.session = requests.Session()
 		self.session.verify = self.config.verify_ssl
+		adapter = HTTPAdapter(
+			pool_maxsize=self.config.pool_maxsize,
+			max_retries=Retry(
+				total=self.config.max_retries,
+				backoff_factor=0.3,
+				status_forcelist=(502, 503, 504),
+				raise_on_status=False,
+			),
+		)
+		self.session.mount('https://', adapter)
+		self.session.mount('http://', adapter)
 		self.authenticate()
 
 		# Initialize resources
@@ -287,7 +304,7 @@ class OICClient:
 				return {}
 
 			try:
-				return response.json()
+				return loads(response.content)
 			except ValueError:
 				return {'content': response.content}
 
@@ -34,6 +34,8 @@ CONFIG_SCHEMA = {
 			'scope': {'type': 'string'},
 			'timeout': {'type': 'integer', 'minimum': 1},
 			'verify_ssl': {'type': 'boolean'},
+			'pool_maxsize': {'type': 'integer', 'minimum': 1},
+			'max_retries': {'type': 'integer', 'minimum': 0},
 		},
 		'additionalProperties': False,
 	},
@@ -215,3 +217,13 @@ class OICConfig:
 	def verify_ssl(self) -> bool:
 		"""Get whether to verify SSL certificates, defaults to True."""
 		return self.profile_config.get('verify_ssl', True)
+
+	@property
+	def pool_maxsize(self) -> int:
+		"""Get the number of kept-alive HTTP connections to pool, defaults to 32."""
+		return self.profile_config.get('pool_maxsize', 32)
+
+	@property
+	def max_retries(self) -> int:
+		"""Get how often to retry requests failing with 502, 503 or 504, defaults to 3."""
+		return self.profile_config.get('max_retries', 3)
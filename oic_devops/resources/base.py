@@ -5,7 +5,11 @@ This module provides the base class for all resource-specific clients.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional
+
+from oic_devops.exceptions import OICError
 
 
 class BaseResource:
@@ -155,6 +159,49 @@ class BaseResource:
 		"""
 		return self.client.get(self._get_endpoint(resource_id), params=params)
 
+	def get_many(
+		self,
+		resource_ids: Iterable[str],
+		params: Optional[Dict[str, Any]] = None,
+		max_workers: int = 16,
+		raw: bool = False,
+	) -> Dict[str, Any]:
+		"""
+		Get several resources by ID, fetching them concurrently.
+
+		Args:
+		    resource_ids: IDs of the resources to retrieve.
+		    params: Optional query parameters for each request.
+		    max_workers: Maximum number of requests to run at once, never more
+		        than the client's HTTP connection pool size.
+		    raw: Whether to ask get for the raw JSON, for resources whose get
+		        builds structured output by default.
+
+		Returns:
+		    Dict: Each resource ID mapped to its data, or to the OICError raised
+		        while retrieving it.
+
+		"""
+		resource_ids = list(dict.fromkeys(resource_ids))
+		if not resource_ids:
+			return {}
+
+		# Only resources with structured output accept raw
+		get = partial(self.get, raw=True) if raw else self.get
+
+		def fetch(resource_id: str) -> Any:
+			try:
+				return get(resource_id, params)
+			except OICError as e:
+				return e
+
+		with ThreadPoolExecutor(
+			max_workers=min(
+				max_workers, len(resource_ids), self.client.config.pool_maxsize
+			)
+		) as executor:
+			return dict(zip(resource_ids, executor.map(fetch, resource_ids)))
+
 	def create(
 		self, data: Dict[str, Any], params: Optional[Dict[str, Any]] = None
 	) -> Dict[str, Any]:
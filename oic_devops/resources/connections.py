@@ -5,7 +5,7 @@ This module provides functionality for managing OIC connections.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 from pandas import Series
@@ -68,24 +68,38 @@ class ConnectionsResource(BaseResource):
 		    List[Dict]: List of integrations.
 
 		"""
-		has_more = True
-		output = []
-		pages = 0
+		return list(self.iter_all(params))
 
-		if not params:
-			params = dict()
+	def iter_all(
+		self, params: Optional[Dict[str, Any]] = None
+	) -> Iterator[Dict[str, Any]]:
+		"""
+		Lazily paginate through the API, yielding connections one page at a time.
+
+		The next page is only requested once the current page has been consumed,
+		so callers can start working on the first connections straight away.
+
+		Args:
+		    params: Optional query parameters, as for list_all.
+
+		Yields:
+		    Dict: Each connection.
+
+		"""
+		params = dict(params or {})
+		offset = params.get('offset', 0)
 
-		while has_more is True:
-			params['offset'] = pages
+		while True:
+			params['offset'] = offset
 			content = self.list(params=params)
-			output.extend(content['items'])
-			has_more = content['hasMore']
-			if not content.get('limit'):
-				continue
-			pages += content['limit']
-			self.logger.info(f'Number of Connections Acquired in List: {pages}')
+			items = content.get('items', [])
+			yield from items
 
-		return output
+			if not content.get('hasMore') or not items:
+				break
+
+			offset += content.get('limit') or len(items)
+			self.logger.info(f'Number of Connections Acquired in List: {offset}')
 
 	def df(self, **kwargs):
 		"""
@@ -173,6 +187,21 @@ class ConnectionsResource(BaseResource):
 
 		return pd.Series(struct_output)
 
+	def get_by_identifier(self, identifier: str) -> Optional[Dict[str, Any]]:
+		"""
+		Find a connection by its identifier.
+
+		Args:
+		    identifier: Identifier of the connection.
+
+		Returns:
+		    Optional[Dict]: The connection, or None if there is no such connection.
+
+		"""
+		params = {'q': f'identifier:{identifier}'}
+		matches = self.list(params=params).get('items', [])
+		return matches[0] if matches else None
+
 	def update(
 		self,
 		connection_id: str,
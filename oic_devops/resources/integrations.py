@@ -6,7 +6,7 @@ This module provides functionality for managing OIC integrations.
 
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
 
 import pandas as pd
 
@@ -15,6 +15,23 @@ from oic_devops.resources.base import BaseResource
 from oic_devops.utils.str import camel_to_snake
 
 
+def _endpoint_connection_id(end_point: Any) -> Optional[str]:
+	"""
+	Get the ID of the connection used by an integration endpoint.
+
+	Args:
+	    end_point: The endpoint entry, usually a dict.
+
+	Returns:
+	    Optional[str]: The connection ID, or None if the endpoint has none.
+
+	"""
+	try:
+		return end_point['connection']['id']
+	except (KeyError, TypeError):
+		return None
+
+
 class IntegrationsResource(BaseResource):
 	"""
 	Class for managing OIC integrations.
@@ -71,24 +88,38 @@ class IntegrationsResource(BaseResource):
 		    List[Dict]: List of integrations.
 
 		"""
-		has_more = True
-		output = []
-		pages = 0
+		return list(self.iter_all(params))
+
+	def iter_all(
+		self, params: Optional[Dict[str, Any]] = None
+	) -> Iterator[Dict[str, Any]]:
+		"""
+		Lazily paginate through the API, yielding integrations one page at a time.
+
+		The next page is only requested once the current page has been consumed,
+		so callers can start working on the first integrations straight away.
+
+		Args:
+		    params: Optional query parameters, as for list_all.
+
+		Yields:
+		    Dict: Each integration.
 
-		if not params:
-			params = dict()
+		"""
+		params = dict(params or {})
+		offset = params.get('offset', 0)
 
-		while has_more is True:
-			params['offset'] = pages
+		while True:
+			params['offset'] = offset
 			content = self.list(params=params)
-			output.extend(content['items'])
-			has_more = content['hasMore']
-			if not content.get('limit'):
-				continue
-			pages += content['limit']
-			self.logger.info(f'Number of Integrations Acquired in List: {pages}')
+			items = content.get('items', [])
+			yield from items
+
+			if not content.get('hasMore') or not items:
+				break
 
-		return output
+			offset += content.get('limit') or len(items)
+			self.logger.info(f'Number of Integrations Acquired in List: {offset}')
 
 	def df(self, explode = False, **kwargs):
 		"""
@@ -117,13 +148,15 @@ class IntegrationsResource(BaseResource):
 		df['integrations_acquired_at'] = datetime.now()
 		df['integrations_acquired_at'] = pd.to_datetime(df['integrations_acquired_at'])
 		if explode:
+			# An empty catalog has no columns at all
+			if 'end_points' not in df.columns:
+				df['end_points'] = None
 			df = df.explode('end_points')
 			df['end_points'] = df['end_points'].fillna({})
-			df['connection_id'] = df['end_points'].apply(
-				lambda x: x.get('connection', {}).get('id', None)
-				if isinstance(x, dict)
-				else None
-			)
+			# Plain list comprehension, Series.apply adds per-row overhead
+			df['connection_id'] = [
+				_endpoint_connection_id(x) for x in df['end_points'].to_numpy()
+			]
 		return df
 
 	# TODO: setup async for workflow speed ups
@@ -297,6 +330,38 @@ class IntegrationsResource(BaseResource):
 		Raises:
 		    OICAPIError: If the export fails.
 
+		"""
+		content = self.export_archive(integration_id, params)
+
+		# Write the content to the file
+		file_path = file_path.replace('|', '-')
+		if not file_path.endswith('.zip'):
+			file_path = file_path + '.zip'
+
+		try:
+			with open(file_path, 'wb') as f:
+				f.write(content)
+			self.logger.info(f'Integration exported to {file_path}')
+			return file_path
+		except Exception as e:
+			raise OICAPIError(f'Failed to write export file: {e!s}')
+
+	def export_archive(
+		self, integration_id: str, params: Optional[Dict[str, Any]] = None
+	) -> bytes:
+		"""
+		Export a specific integration archive into memory.
+
+		Args:
+		    integration_id: ID of the integration to export.
+		    params: Optional query parameters.
+
+		Returns:
+		    bytes: The integration archive.
+
+		Raises:
+		    OICAPIError: If the export fails.
+
 		"""
 		# Set custom headers for binary content
 		headers = {'Accept': 'application/octet-stream'}
@@ -311,21 +376,9 @@ class IntegrationsResource(BaseResource):
 
 		# Check if the response contains binary content
 		if 'content' in response and isinstance(response['content'], bytes):
-			# Write the content to the file
-
-			file_path = file_path.replace('|', '-')
-			if not file_path.endswith('.zip'):
-				file_path = file_path + '.zip'
-
-			try:
-				with open(file_path, 'wb') as f:
-					f.write(response['content'])
-				self.logger.info(f'Integration exported to {file_path}')
-				return file_path
-			except Exception as e:
-				raise OICAPIError(f'Failed to write export file: {e!s}')
-		else:
-			raise OICAPIError('Export response did not contain binary content')
+			return response['content']
+
+		raise OICAPIError('Export response did not contain binary content')
 
 	def import_integration(
 		self,
@@ -353,28 +406,56 @@ class IntegrationsResource(BaseResource):
 		if not os.path.exists(file_path):
 			raise OICValidationError(f'Integration file not found: {file_path}')
 
-		# Set up the file for upload
+		# Read the file once up front: the multipart body is built in memory
+		# anyway, and bytes can be sent again if the request is retried
 		try:
 			with open(file_path, 'rb') as f:
-				files = {
-					'file': (os.path.basename(file_path), f, 'application/octet-stream')
-				}
-
-				# Make the import request with data as form fields
-				headers = {'Accept': 'application/json'}
-
-				# Make a custom request that includes both files and form data
-				return self.client.request(
-					'POST',
-					self._get_endpoint(action='import'),
-					data=data,
-					params=params,
-					files=files,
-					headers=headers,
-				)
+				archive = f.read()
+
+			return self.import_archive(
+				archive, os.path.basename(file_path), data=data, params=params
+			)
 		except Exception as e:
 			raise OICAPIError(f'Failed to import integration: {e!s}')
 
+	def import_archive(
+		self,
+		archive: Union[bytes, BinaryIO],
+		file_name: str,
+		data: Optional[Dict[str, Any]] = None,
+		params: Optional[Dict[str, Any]] = None,
+	) -> Dict[str, Any]:
+		"""
+		Import an integration from an archive in memory or an open file.
+
+		Args:
+		    archive: The integration archive, as bytes or a binary file.
+		    file_name: File name to upload the archive as.
+		    data: Optional import data.
+		    params: Optional query parameters.
+
+		Returns:
+		    Dict: The import result data.
+
+		Raises:
+		    OICAPIError: If the import fails.
+
+		"""
+		files = {'file': (file_name, archive, 'application/octet-stream')}
+
+		# Make the import request with data as form fields
+		headers = {'Accept': 'application/json'}
+
+		# Make a custom request that includes both files and form data
+		return self.client.request(
+			'POST',
+			self._get_endpoint(action='import'),
+			data=data,
+			params=params,
+			files=files,
+			headers=headers,
+		)
+
 	def clone(
 		self,
 		integration_id: str,
@@ -5,7 +5,7 @@ This module provides functionality for managing OIC libraries.
 """
 
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 
 from oic_devops.exceptions import OICAPIError, OICValidationError
 from oic_devops.resources.base import BaseResource
@@ -147,6 +147,34 @@ class LibrariesResource(BaseResource):
 		Raises:
 		    OICAPIError: If the export fails.
 
+		"""
+		content = self.export_archive(library_id, params)
+
+		# Write the content to the file
+		try:
+			with open(file_path, 'wb') as f:
+				f.write(content)
+			self.logger.info(f'Library exported to {file_path}')
+			return file_path
+		except Exception as e:
+			raise OICAPIError(f'Failed to write export file: {e!s}')
+
+	def export_archive(
+		self, library_id: str, params: Optional[Dict[str, Any]] = None
+	) -> bytes:
+		"""
+		Export a specific library into memory.
+
+		Args:
+		    library_id: ID of the library to export.
+		    params: Optional query parameters.
+
+		Returns:
+		    bytes: The exported library file content.
+
+		Raises:
+		    OICAPIError: If the export fails.
+
 		"""
 		# Set custom headers for binary content
 		headers = {'Accept': 'application/octet-stream'}
@@ -161,16 +189,9 @@ class LibrariesResource(BaseResource):
 
 		# Check if the response contains binary content
 		if 'content' in response and isinstance(response['content'], bytes):
-			# Write the content to the file
-			try:
-				with open(file_path, 'wb') as f:
-					f.write(response['content'])
-				self.logger.info(f'Library exported to {file_path}')
-				return file_path
-			except Exception as e:
-				raise OICAPIError(f'Failed to write export file: {e!s}')
-		else:
-			raise OICAPIError('Export response did not contain binary content')
+			return response['content']
+
+		raise OICAPIError('Export response did not contain binary content')
 
 	def import_library(
 		self,
@@ -198,28 +219,56 @@ class LibrariesResource(BaseResource):
 		if not os.path.exists(file_path):
 			raise OICValidationError(f'Library file not found: {file_path}')
 
-		# Set up the file for upload
+		# Read the file once up front: the multipart body is built in memory
+		# anyway, and bytes can be sent again if the request is retried
 		try:
 			with open(file_path, 'rb') as f:
-				files = {
-					'file': (os.path.basename(file_path), f, 'application/octet-stream')
-				}
-
-				# Make the import request with data as form fields
-				headers = {'Accept': 'application/json'}
-
-				# Make a custom request that includes both files and form data
-				return self.client.request(
-					'POST',
-					self._get_endpoint(action='import'),
-					data=data,
-					params=params,
-					files=files,
-					headers=headers,
-				)
+				archive = f.read()
+
+			return self.import_archive(
+				archive, os.path.basename(file_path), data=data, params=params
+			)
 		except Exception as e:
 			raise OICAPIError(f'Failed to import library: {e!s}')
 
+	def import_archive(
+		self,
+		archive: Union[bytes, BinaryIO],
+		file_name: str,
+		data: Optional[Dict[str, Any]] = None,
+		params: Optional[Dict[str, Any]] = None,
+	) -> Dict[str, Any]:
+		"""
+		Import a library from an archive in memory or an open file.
+
+		Args:
+		    archive: The library archive, as bytes or a binary file.
+		    file_name: File name to upload the archive as.
+		    data: Optional import data.
+		    params: Optional query parameters.
+
+		Returns:
+		    Dict: The import result data.
+
+		Raises:
+		    OICAPIError: If the import fails.
+
+		"""
+		files = {'file': (file_name, archive, 'application/octet-stream')}
+
+		# Make the import request with data as form fields
+		headers = {'Accept': 'application/json'}
+
+		# Make a custom request that includes both files and form data
+		return self.client.request(
+			'POST',
+			self._get_endpoint(action='import'),
+			data=data,
+			params=params,
+			files=files,
+			headers=headers,
+		)
+
 	def get_types(
 		self, params: Optional[Dict[str, Any]] = None
 	) -> List[Dict[str, Any]]:
@@ -0,0 +1,89 @@
+"""
+Serialization module for the OIC DevOps package.
+
+This module provides JSON encoding and decoding helpers. orjson is used
+when it is installed, otherwise the standard library json module is used.
+"""
+
+import datetime
+import json
+from typing import Any, Union
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
+def _default(obj: Any) -> Any:
+	"""
+	Convert objects that are not natively JSON serializable.
+
+	Args:
+	    obj: The object to convert.
+
+	Returns:
+	    Any: A JSON serializable representation of the object.
+
+	"""
+	if isinstance(obj, (datetime.datetime, datetime.date)):
+		return obj.isoformat()
+	return str(obj)
+
+
+def dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+	"""
+	Serialize an object to UTF-8 encoded JSON.
+
+	Args:
+	    obj: The object to serialize.
+	    pretty: Whether to format the JSON with indentation.
+
+	Returns:
+	    bytes: The JSON document.
+
+	"""
+	if orjson is not None:
+		option = orjson.OPT_NON_STR_KEYS
+		if pretty:
+			option |= orjson.OPT_INDENT_2
+		return orjson.dumps(obj, default=_default, option=option)
+
+	return dumps(obj, pretty=pretty).encode('utf-8')
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+	"""
+	Serialize an object to a JSON string.
+
+	Args:
+	    obj: The object to serialize.
+	    pretty: Whether to format the JSON with indentation.
+
+	Returns:
+	    str: The JSON document.
+
+	"""
+	if orjson is not None:
+		return dumps_bytes(obj, pretty=pretty).decode('utf-8')
+
+	return json.dumps(obj, indent=2 if pretty else None, default=_default)
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+	"""
+	Deserialize a JSON document.
+
+	Args:
+	    data: The JSON document as text or bytes.
+
+	Returns:
+	    Any: The deserialized object.
+
+	"""
+	if orjson is not None:
+		return orjson.loads(data)
+
+	if isinstance(data, memoryview):
+		data = data.tobytes()
+	return json.loads(data)
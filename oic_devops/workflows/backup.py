@@ -5,17 +5,62 @@ This module provides workflow operations for backing up OIC resources,
 including automated backups, bulk exports, and restoration.
 """
 
+import bisect
 import datetime
+import fnmatch
 import glob
 import json
 import os
+import re
 import shutil
-from typing import List, Optional
+import tempfile
+import threading
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from oic_devops.client import OICClient
-from oic_devops.exceptions import OICError
+from oic_devops.exceptions import OICError, OICValidationError
+from oic_devops.utils.serialization import loads
 from oic_devops.workflows.base import BaseWorkflow, WorkflowResult
 
+# Characters that are not allowed in exported file names
+_SANITIZE_RE = re.compile(r'[\\/*?:"<>|]')
+
+# Backup timestamp embedded in backup names, e.g. oic_backup_20240101_120000
+_TIMESTAMP_RE = re.compile(r'_(\d{8}_\d{6})')
+
+# Exported resource file names, format: id_name.ext
+_RESOURCE_FILE_RE = re.compile(r'^([^_]+)_(.+)\.(.+)$')
+
+# Restore temp directories are renamed with this suffix and deleted in the background
+_RESTORE_TEMP_PREFIX = 'oic_restore_'
+_PENDING_DELETE_SUFFIX = '.pending_delete'
+
+# Connection sections and fields redacted from exports without credentials
+_CREDENTIAL_SECTIONS = ('securityProperties', 'connectionProperties', 'properties')
+_CREDENTIAL_FIELDS = frozenset(
+	(
+		'password',
+		'apiKey',
+		'secretKey',
+		'secret',
+		'token',
+		'accessToken',
+		'refreshToken',
+	)
+)
+
+# Resource type names used when recording restored resources
+_RESOURCE_NAMES = {
+	'integrations': 'integration',
+	'connections': 'connection',
+	'lookups': 'lookup',
+	'libraries': 'library',
+	'packages': 'package',
+}
+
 
 class BackupWorkflows(BaseWorkflow):
 	"""
@@ -25,6 +70,17 @@ class BackupWorkflows(BaseWorkflow):
 	including full instance backups, resource-specific backups, and restoration.
 	"""
 
+	# Method names for the operations accepted by execute
+	_OPERATIONS = {
+		'full_backup': 'backup_all_resources',
+		'selective_backup': 'backup_selected_resources',
+		'backup_integrations': 'backup_integrations',
+		'backup_lookups': 'backup_lookups',
+		'backup_connections': 'backup_connections',
+		'restore_backup': 'restore_from_backup',
+		'prune_backups': 'prune_old_backups',
+	}
+
 	def execute(self, *args, **kwargs) -> WorkflowResult:
 		"""
 		Execute the specified backup workflow.
@@ -42,20 +98,10 @@ class BackupWorkflows(BaseWorkflow):
 		"""
 		operation = kwargs.pop('operation', None)
 
-		if operation == 'full_backup':
-			return self.backup_all_resources(**kwargs)
-		if operation == 'selective_backup':
-			return self.backup_selected_resources(**kwargs)
-		if operation == 'backup_integrations':
-			return self.backup_integrations(**kwargs)
-		if operation == 'backup_lookups':
-			return self.backup_lookups(**kwargs)
-		if operation == 'backup_connections':
-			return self.backup_connections(**kwargs)
-		if operation == 'restore_backup':
-			return self.restore_from_backup(**kwargs)
-		if operation == 'prune_backups':
-			return self.prune_old_backups(**kwargs)
+		method_name = self._OPERATIONS.get(operation)
+		if method_name is not None:
+			return getattr(self, method_name)(**kwargs)
+
 		result = WorkflowResult(
 			success=False, message=f'Unknown backup workflow operation: {operation}'
 		)
@@ -167,7 +213,7 @@ class BackupWorkflows(BaseWorkflow):
 
 				except OICError as e:
 					self.logger.error(
-						f'Failed to export integration {integration_name}: {e!s}'
+						'Failed to export integration %s: %s', integration_name, e
 					)
 					backup_stats['integrations']['failed'] += 1
 
@@ -192,7 +238,7 @@ class BackupWorkflows(BaseWorkflow):
 						break
 
 		except OICError as e:
-			self.logger.error(f'Failed to get integrations list: {e!s}')
+			self.logger.error('Failed to get integrations list: %s', e)
 			result.add_error('Failed to back up integrations', e)
 			if not continue_on_error:
 				result.success = False
@@ -247,7 +293,7 @@ class BackupWorkflows(BaseWorkflow):
 
 				except OICError as e:
 					self.logger.error(
-						f'Failed to export connection {connection_name}: {e!s}'
+						'Failed to export connection %s: %s', connection_name, e
 					)
 					backup_stats['connections']['failed'] += 1
 
@@ -274,7 +320,7 @@ class BackupWorkflows(BaseWorkflow):
 						break
 
 		except OICError as e:
-			self.logger.error(f'Failed to get connections list: {e!s}')
+			self.logger.error('Failed to get connections list: %s', e)
 			result.add_error('Failed to back up connections', e)
 			if not continue_on_error:
 				result.success = False
@@ -325,7 +371,7 @@ class BackupWorkflows(BaseWorkflow):
 					)
 
 				except OICError as e:
-					self.logger.error(f'Failed to export lookup {lookup_name}: {e!s}')
+					self.logger.error('Failed to export lookup %s: %s', lookup_name, e)
 					backup_stats['lookups']['failed'] += 1
 
 					# Add to resources
@@ -349,7 +395,7 @@ class BackupWorkflows(BaseWorkflow):
 						break
 
 		except OICError as e:
-			self.logger.error(f'Failed to get lookups list: {e!s}')
+			self.logger.error('Failed to get lookups list: %s', e)
 			result.add_error('Failed to back up lookups', e)
 			if not continue_on_error:
 				result.success = False
@@ -400,7 +446,9 @@ class BackupWorkflows(BaseWorkflow):
 					)
 
 				except OICError as e:
-					self.logger.error(f'Failed to export library {library_name}: {e!s}')
+					self.logger.error(
+						'Failed to export library %s: %s', library_name, e
+					)
 					backup_stats['libraries']['failed'] += 1
 
 					# Add to resources
@@ -424,7 +472,7 @@ class BackupWorkflows(BaseWorkflow):
 						break
 
 		except OICError as e:
-			self.logger.error(f'Failed to get libraries list: {e!s}')
+			self.logger.error('Failed to get libraries list: %s', e)
 			result.add_error('Failed to back up libraries', e)
 			if not continue_on_error:
 				result.success = False
@@ -477,7 +525,7 @@ class BackupWorkflows(BaseWorkflow):
 
 					except OICError as e:
 						self.logger.error(
-							f'Failed to export package {package_name}: {e!s}'
+							'Failed to export package %s: %s', package_name, e
 						)
 						backup_stats['packages']['failed'] += 1
 
@@ -502,7 +550,7 @@ class BackupWorkflows(BaseWorkflow):
 							break
 
 			except OICError as e:
-				self.logger.error(f'Failed to get packages list: {e!s}')
+				self.logger.error('Failed to get packages list: %s', e)
 				result.add_error('Failed to back up packages', e)
 				if not continue_on_error:
 					result.success = False
@@ -542,7 +590,7 @@ class BackupWorkflows(BaseWorkflow):
 				self.logger.info(f'Created backup metadata at {metadata_file}')
 
 			except Exception as e:
-				self.logger.error(f'Failed to create backup metadata: {e!s}')
+				self.logger.error('Failed to create backup metadata: %s', e)
 				# Continue with backup even if metadata creation fails
 
 		# Compress backup if requested
@@ -566,7 +614,7 @@ class BackupWorkflows(BaseWorkflow):
 				backup_path = archive_path
 
 			except Exception as e:
-				self.logger.error(f'Failed to compress backup: {e!s}')
+				self.logger.error('Failed to compress backup: %s', e)
 				# Continue even if compression fails
 
 		# Calculate total backup statistics
@@ -730,7 +778,7 @@ class BackupWorkflows(BaseWorkflow):
 
 				except OICError as e:
 					self.logger.error(
-						f'Failed to export integration {integration_id}: {e!s}'
+						'Failed to export integration %s: %s', integration_id, e
 					)
 					backup_stats['integrations']['failed'] += 1
 
@@ -789,7 +837,7 @@ class BackupWorkflows(BaseWorkflow):
 
 				except OICError as e:
 					self.logger.error(
-						f'Failed to export connection {connection_id}: {e!s}'
+						'Failed to export connection %s: %s', connection_id, e
 					)
 					backup_stats['connections']['failed'] += 1
 
@@ -847,7 +895,7 @@ class BackupWorkflows(BaseWorkflow):
 					)
 
 				except OICError as e:
-					self.logger.error(f'Failed to export lookup {lookup_id}: {e!s}')
+					self.logger.error('Failed to export lookup %s: %s', lookup_id, e)
 					backup_stats['lookups']['failed'] += 1
 
 					# Add to resources
@@ -902,7 +950,7 @@ class BackupWorkflows(BaseWorkflow):
 					)
 
 				except OICError as e:
-					self.logger.error(f'Failed to export library {library_id}: {e!s}')
+					self.logger.error('Failed to export library %s: %s', library_id, e)
 					backup_stats['libraries']['failed'] += 1
 
 					# Add to resources
@@ -957,7 +1005,7 @@ class BackupWorkflows(BaseWorkflow):
 					)
 
 				except OICError as e:
-					self.logger.error(f'Failed to export package {package_id}: {e!s}')
+					self.logger.error('Failed to export package %s: %s', package_id, e)
 					backup_stats['packages']['failed'] += 1
 
 					# Add to resources
@@ -1002,7 +1050,7 @@ class BackupWorkflows(BaseWorkflow):
 			self.logger.info(f'Created backup metadata at {metadata_file}')
 
 		except Exception as e:
-			self.logger.error(f'Failed to create backup metadata: {e!s}')
+			self.logger.error('Failed to create backup metadata: %s', e)
 			# Continue with backup even if metadata creation fails
 
 		# Compress backup if requested
@@ -1026,7 +1074,7 @@ class BackupWorkflows(BaseWorkflow):
 				backup_path = archive_path
 
 			except Exception as e:
-				self.logger.error(f'Failed to compress backup: {e!s}')
+				self.logger.error('Failed to compress backup: %s', e)
 				# Continue even if compression fails
 
 		# Calculate total backup statistics
@@ -1206,13 +1254,15 @@ class BackupWorkflows(BaseWorkflow):
 
 						except OICError as e:
 							self.logger.warning(
-								f'Failed to get dependencies for integration {integration_name}: {e!s}'
+								'Failed to get dependencies for integration %s: %s',
+								integration_name,
+								e,
 							)
 							# Continue even if we can't get dependencies
 
 				except OICError as e:
 					self.logger.error(
-						f'Failed to export integration {integration_name}: {e!s}'
+						'Failed to export integration %s: %s', integration_name, e
 					)
 					backup_stats['integrations']['failed'] += 1
 
@@ -1277,7 +1327,7 @@ class BackupWorkflows(BaseWorkflow):
 
 						except OICError as e:
 							self.logger.error(
-								f'Failed to export connection {connection_id}: {e!s}'
+								'Failed to export connection %s: %s', connection_id, e
 							)
 							backup_stats['connections']['failed'] += 1
 
@@ -1327,7 +1377,7 @@ class BackupWorkflows(BaseWorkflow):
 
 						except OICError as e:
 							self.logger.error(
-								f'Failed to export lookup {lookup_id}: {e!s}'
+								'Failed to export lookup %s: %s', lookup_id, e
 							)
 							backup_stats['lookups']['failed'] += 1
 
@@ -1341,7 +1391,7 @@ class BackupWorkflows(BaseWorkflow):
 							# Continue even if one dependency fails
 
 		except OICError as e:
-			self.logger.error(f'Failed to get integrations: {e!s}')
+			self.logger.error('Failed to get integrations: %s', e)
 			result.add_error('Failed to get integrations', e)
 			result.success = False
 			result.message = 'Backup failed when retrieving integrations'
@@ -1367,7 +1417,7 @@ class BackupWorkflows(BaseWorkflow):
 			self.logger.info(f'Created backup metadata at {metadata_file}')
 
 		except Exception as e:
-			self.logger.error(f'Failed to create backup metadata: {e!s}')
+			self.logger.error('Failed to create backup metadata: %s', e)
 			# Continue with backup even if metadata creation fails
 
 		# Compress backup if requested
@@ -1391,7 +1441,7 @@ class BackupWorkflows(BaseWorkflow):
 				backup_path = archive_path
 
 			except Exception as e:
-				self.logger.error(f'Failed to compress backup: {e!s}')
+				self.logger.error('Failed to compress backup: %s', e)
 				# Continue even if compression fails
 
 		# Calculate total backup statistics
@@ -1557,7 +1607,7 @@ class BackupWorkflows(BaseWorkflow):
 
 						except OICError as e:
 							self.logger.warning(
-								f'Failed to get data for lookup {lookup_name}: {e!s}'
+								'Failed to get data for lookup %s: %s', lookup_name, e
 							)
 							backup_stats['lookup_data']['failed'] += 1
 							backup_stats['lookup_data']['total'] += 1
@@ -1565,7 +1615,7 @@ class BackupWorkflows(BaseWorkflow):
 							# Continue even if we can't get data for one lookup
 
 				except OICError as e:
-					self.logger.error(f'Failed to export lookup {lookup_name}: {e!s}')
+					self.logger.error('Failed to export lookup %s: %s', lookup_name, e)
 					backup_stats['lookups']['failed'] += 1
 
 					# Add to resources
@@ -1589,7 +1639,7 @@ class BackupWorkflows(BaseWorkflow):
 						break
 
 		except OICError as e:
-			self.logger.error(f'Failed to get lookups: {e!s}')
+			self.logger.error('Failed to get lookups: %s', e)
 			result.add_error('Failed to get lookups', e)
 			result.success = False
 			result.message = 'Backup failed when retrieving lookups'
@@ -1615,7 +1665,7 @@ class BackupWorkflows(BaseWorkflow):
 			self.logger.info(f'Created backup metadata at {metadata_file}')
 
 		except Exception as e:
-			self.logger.error(f'Failed to create backup metadata: {e!s}')
+			self.logger.error('Failed to create backup metadata: %s', e)
 			# Continue with backup even if metadata creation fails
 
 		# Compress backup if requested
@@ -1639,7 +1689,7 @@ class BackupWorkflows(BaseWorkflow):
 				backup_path = archive_path
 
 			except Exception as e:
-				self.logger.error(f'Failed to compress backup: {e!s}')
+				self.logger.error('Failed to compress backup: %s', e)
 				# Continue even if compression fails
 
 		# Calculate total backup statistics
@@ -1741,6 +1791,16 @@ class BackupWorkflows(BaseWorkflow):
 				result.message = 'No connections found matching the filter criteria'
 				return result
 
+			# Fetch connection details concurrently up front, as raw JSON
+			all_details = self.client.connections.get_many(
+				(
+					connection.get('id')
+					for connection in connections
+					if connection.get('id')
+				),
+				raw=True,
+			)
+
 			# Back up each connection
 			for connection in connections:
 				connection_id = connection.get('id')
@@ -1752,31 +1812,21 @@ class BackupWorkflows(BaseWorkflow):
 
 				try:
 					# Get connection details
-					connection_details = self.client.connections.get(connection_id)
+					connection_details = all_details[connection_id]
+					if isinstance(connection_details, OICError):
+						raise connection_details
 
 					# Redact credentials if requested
 					if not include_credentials:
 						# Look for credential fields in different properties sections
-						for section in [
-							'securityProperties',
-							'connectionProperties',
-							'properties',
-						]:
-							if section in connection_details:
-								props = connection_details[section]
-
-								# Redact common credential fields
-								for field in [
-									'password',
-									'apiKey',
-									'secretKey',
-									'secret',
-									'token',
-									'accessToken',
-									'refreshToken',
-								]:
-									if field in props:
-										props[field] = '**REDACTED**'
+						for section in _CREDENTIAL_SECTIONS:
+							props = connection_details.get(section)
+							if not isinstance(props, dict):
+								continue
+
+							# Redact common credential fields
+							for field in props.keys() & _CREDENTIAL_FIELDS:
+								props[field] = '**REDACTED**'
 
 					# Create connection export file path
 					export_file = os.path.join(
@@ -1807,7 +1857,7 @@ class BackupWorkflows(BaseWorkflow):
 
 				except OICError as e:
 					self.logger.error(
-						f'Failed to export connection {connection_name}: {e!s}'
+						'Failed to export connection %s: %s', connection_name, e
 					)
 					backup_stats['connections']['failed'] += 1
 
@@ -1835,7 +1885,7 @@ class BackupWorkflows(BaseWorkflow):
 						break
 
 		except OICError as e:
-			self.logger.error(f'Failed to get connections: {e!s}')
+			self.logger.error('Failed to get connections: %s', e)
 			result.add_error('Failed to get connections', e)
 			result.success = False
 			result.message = 'Backup failed when retrieving connections'
@@ -1861,7 +1911,7 @@ class BackupWorkflows(BaseWorkflow):
 			self.logger.info(f'Created backup metadata at {metadata_file}')
 
 		except Exception as e:
-			self.logger.error(f'Failed to create backup metadata: {e!s}')
+			self.logger.error('Failed to create backup metadata: %s', e)
 			# Continue with backup even if metadata creation fails
 
 		# Compress backup if requested
@@ -1885,7 +1935,7 @@ class BackupWorkflows(BaseWorkflow):
 				backup_path = archive_path
 
 			except Exception as e:
-				self.logger.error(f'Failed to compress backup: {e!s}')
+				self.logger.error('Failed to compress backup: %s', e)
 				# Continue even if compression fails
 
 		# Update result details
@@ -1961,13 +2011,14 @@ class BackupWorkflows(BaseWorkflow):
 			try:
 				self.logger.info(f'Extracting backup {backup_path}')
 
-				# Create temporary directory
-				import tempfile
+				# Remove temp directories left behind by earlier restores
+				self._purge_pending_deletes()
 
-				temp_dir = tempfile.mkdtemp(prefix='oic_restore_')
+				# Create temporary directory
+				temp_dir = tempfile.mkdtemp(prefix=_RESTORE_TEMP_PREFIX)
 
 				# Extract backup
-				shutil.unpack_archive(backup_path, temp_dir, format='zip')
+				self._extract_backup(backup_path, temp_dir)
 
 				# Update backup directory
 				backup_dir = temp_dir
@@ -1979,14 +2030,8 @@ class BackupWorkflows(BaseWorkflow):
 				result.add_error('Failed to extract backup', e)
 				return result
 
-		# Initialize restore stats
-		restore_stats = {
-			'integrations': {'total': 0, 'successful': 0, 'failed': 0},
-			'connections': {'total': 0, 'successful': 0, 'failed': 0},
-			'lookups': {'total': 0, 'successful': 0, 'failed': 0},
-			'libraries': {'total': 0, 'successful': 0, 'failed': 0},
-			'packages': {'total': 0, 'successful': 0, 'failed': 0},
-		}
+		# Restore stats, filled in only for resource types present in the backup
+		restore_stats = defaultdict(lambda: {'total': 0, 'successful': 0, 'failed': 0})
 
 		# Read backup metadata if available
 		backup_metadata = None
@@ -1994,15 +2039,52 @@ class BackupWorkflows(BaseWorkflow):
 
 		if os.path.exists(metadata_file):
 			try:
-				with open(metadata_file) as f:
-					backup_metadata = json.load(f)
+				with open(metadata_file, 'rb') as f:
+					backup_metadata = loads(f.read())
 
 				self.logger.info(f'Read backup metadata from {metadata_file}')
 
 			except Exception as e:
-				self.logger.warning(f'Failed to read backup metadata: {e!s}')
+				self.logger.warning('Failed to read backup metadata: %s', e)
 				# Continue even if we can't read metadata
 
+		# Fetch the target's connections once so each imported connection does
+		# not need its own lookup query
+		existing_connections = None
+		if 'connections' in resource_types and os.path.isdir(
+			os.path.join(backup_dir, 'connections')
+		):
+			try:
+				existing_connections = {
+					connection['identifier']: connection
+					for connection in target_client.connections.list_all()
+					if connection.get('identifier')
+				}
+			except OICError as e:
+				self.logger.warning(
+					'Failed to list existing connections, checking each connection individually: %s',
+					e,
+				)
+
+		# Running totals across all resource types
+		total_resources = successful_resources = failed_resources = 0
+
+		# Import function for each resource type, called with
+		# (client, resource_file, overwrite_existing)
+		import_handlers = {
+			'integrations': lambda c, f, o: c.integrations.import_integration(
+				f, {'overwrite': o}
+			),
+			'connections': lambda c, f, o: self._import_connection(
+				c, f, o, existing_connections
+			),
+			'lookups': lambda c, f, o: c.lookups.import_lookup(f, {'overwrite': o}),
+			'libraries': lambda c, f, o: c.libraries.import_library(
+				f, {'overwrite': o}
+			),
+			'packages': lambda c, f, o: c.packages.import_package(f, {'overwrite': o}),
+		}
+
 		# Restore each resource type
 		for resource_type in resource_types:
 			# Check if resource directory exists
@@ -2013,6 +2095,11 @@ class BackupWorkflows(BaseWorkflow):
 				)
 				continue
 
+			import_handler = import_handlers.get(resource_type)
+			if import_handler is None:
+				self.logger.warning(f'Restoring {resource_type} is not supported')
+				continue
+
 			self.logger.info(f'Restoring {resource_type}')
 
 			# Get list of resource files
@@ -2025,7 +2112,10 @@ class BackupWorkflows(BaseWorkflow):
 					f for f in resource_files if pattern.search(os.path.basename(f))
 				]
 
-			restore_stats[resource_type]['total'] = len(resource_files)
+			stats = restore_stats[resource_type]
+			stats['total'] = len(resource_files)
+			total_resources += len(resource_files)
+			record_type = _RESOURCE_NAMES[resource_type]
 
 			# Import each resource
 			for resource_file in resource_files:
@@ -2034,7 +2124,7 @@ class BackupWorkflows(BaseWorkflow):
 				try:
 					# Extract resource ID and name from filename
 					# Format: id_name.ext
-					match = re.match(r'^([^_]+)_(.+)\.(.+)$', file_name)
+					match = _RESOURCE_FILE_RE.match(file_name)
 					if match:
 						resource_id = match.group(1)
 						resource_name = match.group(2)
@@ -2048,201 +2138,39 @@ class BackupWorkflows(BaseWorkflow):
 					self.logger.info(f'Restoring {resource_type} from {file_name}')
 
 					# Perform import based on resource type
-					if resource_type == 'integrations':
-						# Import integration
-						import_result = target_client.integrations.import_integration(
-							resource_file, {'overwrite': overwrite_existing}
-						)
-
-						# Extract imported resource details
-						imported_id = import_result.get('id')
-						imported_name = import_result.get('name', 'Unknown')
-
-						# Update stats
-						restore_stats[resource_type]['successful'] += 1
-
-						# Add to resources
-						result.add_resource(
-							'integration',
-							imported_id,
-							{
-								'name': imported_name,
-								'source_file': resource_file,
-								'restore_successful': True,
-							},
-						)
-
-					elif resource_type == 'connections':
-						# Import connection from JSON
-						with open(resource_file) as f:
-							connection_data = json.load(f)
-
-						# Check if connection exists
-						try:
-							# Try to find existing connection by identifier
-							identifier = connection_data.get('identifier')
-							existing = None
-
-							if identifier:
-								params = {'q': f'identifier:{identifier}'}
-								existing_connections = target_client.connections.list(
-									params=params
-								)
-
-								if existing_connections:
-									existing = existing_connections[0]
-									existing_id = existing['id']
-
-									if overwrite_existing:
-										# Update existing connection
-										import_result = (
-											target_client.connections.update(
-												existing_id, connection_data
-											)
-										)
-									else:
-										# Skip without error
-										self.logger.info(
-											f'Skipping existing connection: {existing.get("name", "Unknown")}'
-										)
-										import_result = existing
-								else:
-									# Create new connection
-									import_result = target_client.connections.create(
-										connection_data
-									)
-							else:
-								# Create new connection
-								import_result = target_client.connections.create(
-									connection_data
-								)
-
-							# Extract imported resource details
-							imported_id = import_result.get('id')
-							imported_name = import_result.get('name', 'Unknown')
-
-							# Update stats
-							restore_stats[resource_type]['successful'] += 1
-
-							# Add to resources
-							result.add_resource(
-								'connection',
-								imported_id,
-								{
-									'name': imported_name,
-									'source_file': resource_file,
-									'restore_successful': True,
-								},
-							)
-
-						except OICError as e:
-							self.logger.error(
-								f'Failed to import connection {resource_name}: {e!s}'
-							)
-							restore_stats[resource_type]['failed'] += 1
-
-							# Add to resources
-							result.add_resource(
-								'connection',
-								resource_id,
-								{
-									'name': resource_name,
-									'source_file': resource_file,
-									'restore_successful': False,
-									'error': str(e),
-								},
-							)
-
-							# Stop if continue_on_error is False
-							if not continue_on_error:
-								result.success = False
-								result.message = f'Restore failed when importing connection {resource_name}'
-								result.add_error(
-									'Failed to import connection', e, resource_id
-								)
-								break
-
-					elif resource_type == 'lookups':
-						# Import lookup
-						import_result = target_client.lookups.import_lookup(
-							resource_file, {'overwrite': overwrite_existing}
-						)
-
-						# Extract imported resource details
-						imported_id = import_result.get('id')
-						imported_name = import_result.get('name', 'Unknown')
-
-						# Update stats
-						restore_stats[resource_type]['successful'] += 1
-
-						# Add to resources
-						result.add_resource(
-							'lookup',
-							imported_id,
-							{
-								'name': imported_name,
-								'source_file': resource_file,
-								'restore_successful': True,
-							},
-						)
-
-					elif resource_type == 'libraries':
-						# Import library
-						import_result = target_client.libraries.import_library(
-							resource_file, {'overwrite': overwrite_existing}
-						)
-
-						# Extract imported resource details
-						imported_id = import_result.get('id')
-						imported_name = import_result.get('name', 'Unknown')
-
-						# Update stats
-						restore_stats[resource_type]['successful'] += 1
-
-						# Add to resources
-						result.add_resource(
-							'library',
-							imported_id,
-							{
-								'name': imported_name,
-								'source_file': resource_file,
-								'restore_successful': True,
-							},
-						)
-
-					elif resource_type == 'packages':
-						# Import package
-						import_result = target_client.packages.import_package(
-							resource_file, {'overwrite': overwrite_existing}
-						)
+					import_result = import_handler(
+						target_client, resource_file, overwrite_existing
+					)
 
-						# Extract imported resource details
-						imported_id = import_result.get('id')
-						imported_name = import_result.get('name', 'Unknown')
+					# Extract imported resource details
+					imported_id = import_result.get('id')
+					imported_name = import_result.get('name', 'Unknown')
 
-						# Update stats
-						restore_stats[resource_type]['successful'] += 1
+					# Update stats
+					stats['successful'] += 1
+					successful_resources += 1
 
-						# Add to resources
-						result.add_resource(
-							'package',
-							imported_id,
-							{
-								'name': imported_name,
-								'source_file': resource_file,
-								'restore_successful': True,
-							},
-						)
+					# Add to resources
+					result.add_resource(
+						record_type,
+						imported_id,
+						{
+							'name': imported_name,
+							'source_file': resource_file,
+							'restore_successful': True,
+						},
+					)
 
 				except OICError as e:
 					self.logger.error(
-						f'Failed to import {resource_type} {resource_name}: {e!s}'
+						'Failed to import %s %s: %s', resource_type, resource_name, e
 					)
-					restore_stats[resource_type]['failed'] += 1
+					stats['failed'] += 1
+					failed_resources += 1
 
 					# Add to resources
 					result.add_resource(
-						resource_type[:-1],
+						record_type,
 						resource_id,
 						{
 							'name': resource_name,
@@ -2264,25 +2192,13 @@ class BackupWorkflows(BaseWorkflow):
 		# Clean up temporary directory if used
 		if temp_dir:
 			try:
-				shutil.rmtree(temp_dir)
-				self.logger.info(f'Cleaned up temporary directory {temp_dir}')
+				self._discard_temp_dir(temp_dir)
+				self.logger.info(f'Scheduled cleanup of temporary directory {temp_dir}')
 			except Exception as e:
-				self.logger.warning(f'Failed to clean up temporary directory: {e!s}')
-
-		# Calculate total restore statistics
-		total_resources = sum(
-			restore_stats[resource_type]['total'] for resource_type in restore_stats
-		)
-		successful_resources = sum(
-			restore_stats[resource_type]['successful']
-			for resource_type in restore_stats
-		)
-		failed_resources = sum(
-			restore_stats[resource_type]['failed'] for resource_type in restore_stats
-		)
+				self.logger.warning('Failed to clean up temporary directory: %s', e)
 
 		# Update result details
-		result.details['restore_stats'] = restore_stats
+		result.details['restore_stats'] = dict(restore_stats)
 		result.details['backup_path'] = backup_path
 		result.details['backup_metadata'] = backup_metadata
 		result.details['total_resources'] = total_resources
@@ -2334,20 +2250,18 @@ class BackupWorkflows(BaseWorkflow):
 			result.add_error('Backup directory does not exist')
 			return result
 
-		# Find all backup files and directories
+		# Find all backup zip files and directories in a single directory pass
 		backup_files = []
 
-		# Look for zip files
-		zip_files = glob.glob(os.path.join(backup_dir, 'oic_*_backup_*.zip'))
-		backup_files.extend(zip_files)
+		with os.scandir(backup_dir) as entries:
+			for entry in entries:
+				if not fnmatch.fnmatchcase(entry.name, 'oic_*_backup_*'):
+					continue
 
-		# Look for backup directories
-		backup_dirs = [
-			d
-			for d in glob.glob(os.path.join(backup_dir, 'oic_*_backup_*'))
-			if os.path.isdir(d)
-		]
-		backup_files.extend(backup_dirs)
+				if entry.is_file() and entry.name.endswith('.zip'):
+					backup_files.append((entry.path, False))
+				elif entry.is_dir():
+					backup_files.append((entry.path, True))
 
 		if not backup_files:
 			result.message = f'No backups found in {backup_dir}'
@@ -2355,51 +2269,13 @@ class BackupWorkflows(BaseWorkflow):
 
 		self.logger.info(f'Found {len(backup_files)} backups in {backup_dir}')
 
-		# Parse backup information
-		backups_info = []
-
-		for backup_path in backup_files:
-			try:
-				# Extract timestamp from filename
-				filename = os.path.basename(backup_path)
-				timestamp_match = re.search(r'_(\d{8}_\d{6})', filename)
-
-				if timestamp_match:
-					timestamp_str = timestamp_match.group(1)
-					timestamp = datetime.datetime.strptime(
-						timestamp_str, '%Y%m%d_%H%M%S'
-					)
-				else:
-					# If can't extract from filename, use file modification time
-					file_mtime = os.path.getmtime(backup_path)
-					timestamp = datetime.datetime.fromtimestamp(file_mtime)
-
-				# Get file size
-				if os.path.isdir(backup_path):
-					# Calculate directory size
-					total_size = 0
-					for dirpath, dirnames, filenames in os.walk(backup_path):
-						for f in filenames:
-							fp = os.path.join(dirpath, f)
-							total_size += os.path.getsize(fp)
-				else:
-					total_size = os.path.getsize(backup_path)
-
-				# Add to backups info
-				backups_info.append(
-					{
-						'path': backup_path,
-						'timestamp': timestamp,
-						'size': total_size,
-						'is_dir': os.path.isdir(backup_path),
-					}
-				)
-
-			except Exception as e:
-				self.logger.warning(
-					f'Failed to parse backup info for {backup_path}: {e!s}'
-				)
-				# Skip this backup
+		# Parse backup information, stat'ing the backups concurrently
+		with ThreadPoolExecutor(max_workers=min(16, len(backup_files))) as executor:
+			backups_info = [
+				info
+				for info in executor.map(self._scan_backup, backup_files)
+				if info is not None
+			]
 
 		# Sort backups by timestamp, newest first
 		backups_info.sort(key=lambda x: x['timestamp'], reverse=True)
@@ -2412,39 +2288,32 @@ class BackupWorkflows(BaseWorkflow):
 		if len(backups_info) <= retention_count:
 			backups_to_keep = backups_info
 		else:
-			# Keep the newest retention_count backups
-			backups_to_keep = backups_info[:retention_count]
-
-			# Check age for the rest
+			# Keep the newest retention_count backups and any others newer than
+			# the cutoff. The list is sorted newest first, so the older backups
+			# form a suffix found by bisecting the negated timestamps.
 			cutoff_date = datetime.datetime.now() - datetime.timedelta(
 				days=retention_days
 			)
+			keys = [-backup['epoch'] for backup in backups_info]
+			split = bisect.bisect_right(
+				keys, -cutoff_date.timestamp(), lo=retention_count
+			)
 
-			for backup in backups_info[retention_count:]:
-				if backup['timestamp'] >= cutoff_date:
-					backups_to_keep.append(backup)
-				else:
-					backups_to_delete.append(backup)
+			backups_to_keep = backups_info[:split]
+			backups_to_delete = backups_info[split:]
 
 		# Delete backups if not a dry run
 		deleted_backups = []
 
 		if not dry_run:
-			for backup in backups_to_delete:
-				try:
-					backup_path = backup['path']
-					self.logger.info(f'Deleting backup: {backup_path}')
-
-					if os.path.isdir(backup_path):
-						shutil.rmtree(backup_path)
-					else:
-						os.remove(backup_path)
-
+			for backup, error in self._delete_backups(backups_to_delete):
+				if error is None:
 					deleted_backups.append(backup)
-
-				except Exception as e:
-					self.logger.error(f'Failed to delete backup {backup_path}: {e!s}')
-					result.add_error('Failed to delete backup', e)
+				else:
+					self.logger.error(
+						f'Failed to delete backup {backup["path"]}: {error!s}'
+					)
+					result.add_error('Failed to delete backup', error)
 		else:
 			# In dry run, just log
 			for backup in backups_to_delete:
@@ -2480,6 +2349,270 @@ class BackupWorkflows(BaseWorkflow):
 
 		return result
 
+	def _import_connection(
+		self,
+		client: OICClient,
+		resource_file: str,
+		overwrite_existing: bool,
+		existing_connections: Optional[Dict[str, Dict[str, Any]]] = None,
+	) -> Dict[str, Any]:
+		"""
+		Import a connection from an exported JSON file.
+
+		An existing connection with the same identifier is updated when
+		overwrite_existing is set and left untouched otherwise. A new connection
+		is created if none exists.
+
+		Args:
+		    client: The client to import the connection with.
+		    resource_file: Path to the exported connection file.
+		    overwrite_existing: Whether to overwrite an existing connection.
+		    existing_connections: Optional map of identifier to connection for the
+		        target instance. When given it is used instead of querying for each
+		        connection, and is updated with the imported connection.
+
+		Returns:
+		    Dict: The imported or existing connection.
+
+		"""
+		with open(resource_file, 'rb') as f:
+			connection_data = loads(f.read())
+
+		# Try to find existing connection by identifier
+		identifier = connection_data.get('identifier')
+		existing = None
+		if identifier:
+			if existing_connections is not None:
+				existing = existing_connections.get(identifier)
+			else:
+				existing = client.connections.get_by_identifier(identifier)
+
+		if existing and not overwrite_existing:
+			# Skip without error
+			self.logger.info(
+				f'Skipping existing connection: {existing.get("name", "Unknown")}'
+			)
+			return existing
+
+		if existing:
+			# Update existing connection
+			import_result = client.connections.update(existing['id'], connection_data)
+		else:
+			# Create new connection
+			import_result = client.connections.create(connection_data)
+
+		if identifier and existing_connections is not None:
+			existing_connections[identifier] = {**connection_data, **import_result}
+
+		return import_result
+
+	def _extract_backup(self, archive_path: str, target_dir: str) -> None:
+		"""
+		Extract a backup archive, decompressing members in parallel.
+
+		Directories are created first so the worker threads only write files.
+
+		Args:
+		    archive_path: Path to the backup zip file.
+		    target_dir: Directory to extract the backup into.
+
+		Raises:
+		    OICValidationError: If a member would be extracted outside
+		        target_dir.
+
+		"""
+		root = os.path.realpath(target_dir)
+		with zipfile.ZipFile(archive_path) as archive:
+			# Check every member before writing anything
+			members = []
+			for member in archive.infolist():
+				destination = os.path.realpath(os.path.join(root, member.filename))
+				if os.path.commonpath((root, destination)) != root:
+					raise OICValidationError(
+						f'Backup archive member {member.filename} is outside the '
+						'extraction directory'
+					)
+				members.append((member, destination))
+
+			files = []
+			for member, destination in members:
+				if member.is_dir():
+					os.makedirs(destination, exist_ok=True)
+				else:
+					os.makedirs(os.path.dirname(destination), exist_ok=True)
+					files.append((member, destination))
+
+			if not files:
+				return
+
+			def extract(member: zipfile.ZipInfo, destination: str) -> None:
+				# Write to the checked path, ZipFile.extract sanitizes names its own way
+				with archive.open(member) as source, open(destination, 'wb') as target:
+					shutil.copyfileobj(source, target)
+
+			max_workers = min(len(files), os.cpu_count() or 1)
+			with ThreadPoolExecutor(max_workers=max_workers) as executor:
+				# Consume the results so extraction errors are raised here
+				list(executor.map(extract, *zip(*files)))
+
+	def _discard_temp_dir(self, temp_dir: str) -> None:
+		"""
+		Delete a temporary directory without blocking the caller.
+
+		The directory is renamed out of the way and removed by a background
+		thread. Anything the thread does not finish before the process exits
+		is picked up by _purge_pending_deletes on the next restore.
+
+		Args:
+		    temp_dir: The temporary directory to delete.
+
+		"""
+		pending = temp_dir + _PENDING_DELETE_SUFFIX
+		os.rename(temp_dir, pending)
+		threading.Thread(
+			target=shutil.rmtree,
+			args=(pending,),
+			kwargs={'ignore_errors': True},
+			daemon=True,
+		).start()
+
+	def _purge_pending_deletes(self) -> None:
+		"""Remove restore temp directories whose background deletion never finished."""
+		temp_root = tempfile.gettempdir()
+
+		try:
+			with os.scandir(temp_root) as entries:
+				leftovers = [
+					entry.path
+					for entry in entries
+					if entry.name.startswith(_RESTORE_TEMP_PREFIX)
+					and entry.name.endswith(_PENDING_DELETE_SUFFIX)
+					and entry.is_dir(follow_symlinks=False)
+				]
+		except OSError as e:
+			self.logger.debug(
+				'Could not scan %s for leftover restores: %s', temp_root, e
+			)
+			return
+
+		for leftover in leftovers:
+			shutil.rmtree(leftover, ignore_errors=True)
+
+	def _scan_backup(self, backup: Tuple[str, bool]) -> Optional[Dict[str, Any]]:
+		"""
+		Collect the timestamp and size of a single backup.
+
+		Args:
+		    backup: Tuple of the backup path and whether it is a directory.
+
+		Returns:
+		    Optional[Dict]: Backup info, or None if the backup could not be parsed.
+
+		"""
+		backup_path, is_dir = backup
+
+		try:
+			# Extract timestamp from filename
+			filename = os.path.basename(backup_path)
+			timestamp_match = _TIMESTAMP_RE.search(filename)
+
+			if timestamp_match:
+				# Fixed %Y%m%d_%H%M%S layout, sliced directly instead of strptime
+				ts = timestamp_match.group(1)
+				timestamp = datetime.datetime(
+					int(ts[0:4]),
+					int(ts[4:6]),
+					int(ts[6:8]),
+					int(ts[9:11]),
+					int(ts[11:13]),
+					int(ts[13:15]),
+				)
+			else:
+				# If can't extract from filename, use file modification time
+				file_mtime = os.path.getmtime(backup_path)
+				timestamp = datetime.datetime.fromtimestamp(file_mtime)
+
+			# Get file size
+			if is_dir:
+				total_size = self._dir_size(backup_path)
+			else:
+				total_size = os.path.getsize(backup_path)
+
+			return {
+				'path': backup_path,
+				'timestamp': timestamp,
+				'epoch': timestamp.timestamp(),
+				'size': total_size,
+				'is_dir': is_dir,
+			}
+
+		except Exception as e:
+			self.logger.warning(
+				'Failed to parse backup info for %s: %s', backup_path, e
+			)
+			return None
+
+	def _dir_size(self, path: str) -> int:
+		"""
+		Calculate the total size of the files in a directory tree.
+
+		Args:
+		    path: The directory to measure.
+
+		Returns:
+		    int: The total size in bytes.
+
+		"""
+		total_size = 0
+		pending = [path]
+
+		while pending:
+			with os.scandir(pending.pop()) as entries:
+				for entry in entries:
+					if entry.is_dir(follow_symlinks=False):
+						pending.append(entry.path)
+					else:
+						total_size += entry.stat().st_size
+
+		return total_size
+
+	def _delete_backups(
+		self, backups: List[Dict[str, Any]], max_workers: int = 8
+	) -> List[Tuple[Dict[str, Any], Optional[Exception]]]:
+		"""
+		Delete backup files and directories concurrently.
+
+		Each deletion is a blocking filesystem operation, so the deletions are
+		spread over a small thread pool to keep several in flight at once.
+
+		Args:
+		    backups: Backup info dicts as built by prune_old_backups.
+		    max_workers: Maximum number of concurrent deletions.
+
+		Returns:
+		    List[Tuple]: (backup, error) pairs in input order, where error is
+		        None if the backup was deleted.
+
+		"""
+
+		def delete(backup: Dict[str, Any]) -> Optional[Exception]:
+			backup_path = backup['path']
+			self.logger.info(f'Deleting backup: {backup_path}')
+			try:
+				if backup['is_dir']:
+					shutil.rmtree(backup_path)
+				else:
+					os.remove(backup_path)
+			except Exception as e:
+				return e
+			return None
+
+		if not backups:
+			return []
+
+		with ThreadPoolExecutor(max_workers=min(max_workers, len(backups))) as executor:
+			return list(zip(backups, executor.map(delete, backups)))
+
 	def _sanitize_filename(self, name: str) -> str:
 		"""
 		Sanitize a name for use in a filename.
@@ -2492,7 +2625,7 @@ class BackupWorkflows(BaseWorkflow):
 
 		"""
 		# Replace invalid characters with underscores
-		sanitized = re.sub(r'[\\/*?:"<>|]', '_', name)
+		sanitized = _SANITIZE_RE.sub('_', name)
 
 		# Truncate if too long
 		if len(sanitized) > 50:
@@ -4,18 +4,33 @@ Base workflow module for the OIC DevOps package.
 This module provides the base classes for all workflow operations.
 """
 
-import json
 import logging
+import mmap
+import os
+import random
+import sys
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
 from oic_devops.client import OICClient
 from oic_devops.exceptions import OICError
+from oic_devops.utils.serialization import dumps, dumps_bytes, loads
 
+# Result files larger than this are memory-mapped when loaded
+_MMAP_THRESHOLD = 1024 * 1024
 
-@dataclass
+# Integration status polling starts at this interval and backs off up to the cap
+_STATUS_POLL_INTERVAL = 0.25
+_STATUS_POLL_MAX_INTERVAL = 2
+
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class WorkflowResult:
 	"""
 	Data class for storing workflow execution results.
@@ -74,10 +89,21 @@ class WorkflowResult:
 		    data: Resource data.
 
 		"""
-		if resource_type not in self.resources:
-			self.resources[resource_type] = {}
+		self.resources.setdefault(resource_type, {})[resource_id] = data
+
+	def add_resources(
+		self, resource_type: str, resources: Mapping[str, Dict[str, Any]]
+	) -> None:
+		"""
+		Add several resources of one type to the workflow result.
+
+		Args:
+		    resource_type: Type of the resources.
+		    resources: Resource data keyed by resource ID.
 
-		self.resources[resource_type][resource_id] = data
+		"""
+		if resources:
+			self.resources.setdefault(resource_type, {}).update(resources)
 
 	def merge(self, other: 'WorkflowResult') -> 'WorkflowResult':
 		"""
@@ -101,24 +127,60 @@ class WorkflowResult:
 			self.message = other.message
 
 		# Merge details
-		self.details.update(other.details)
+		if other.details:
+			self.details.update(other.details)
 
 		# Merge resources
 		for resource_type, resources in other.resources.items():
-			if resource_type not in self.resources:
-				self.resources[resource_type] = {}
-
-			self.resources[resource_type].update(resources)
+			self.resources.setdefault(resource_type, {}).update(resources)
 
 		# Merge errors
-		self.errors.extend(other.errors)
+		if other.errors:
+			self.errors.extend(other.errors)
+
+		return self
+
+	def merge_many(self, others: Iterable['WorkflowResult']) -> 'WorkflowResult':
+		"""
+		Merge several workflow results into this one, in order.
+
+		Equivalent to merging each result in turn, except that the messages
+		are joined once rather than concatenated again for every result.
+
+		Args:
+		    others: The workflow results to merge.
+
+		Returns:
+		    WorkflowResult: The merged workflow result.
+
+		"""
+		messages = [self.message] if self.message else []
+
+		for other in others:
+			if not other.success:
+				self.success = False
+
+			if other.message:
+				messages.append(other.message)
+
+			if other.details:
+				self.details.update(other.details)
+
+			for resource_type, resources in other.resources.items():
+				self.resources.setdefault(resource_type, {}).update(resources)
+
+			if other.errors:
+				self.errors.extend(other.errors)
 
+		self.message = '; '.join(messages)
 		return self
 
 	def to_dict(self) -> Dict[str, Any]:
 		"""
 		Convert the workflow result to a dictionary.
 
+		The dictionary is shallow: nested containers are shared with the result.
+
 		Returns:
 		    Dict: The workflow result as a dictionary.
 
@@ -131,6 +193,19 @@ class WorkflowResult:
 			'errors': self.errors,
 		}
 
+	def to_mapping(self) -> Mapping[str, Any]:
+		"""
+		Get a read-only view of the workflow result.
+
+		The view shares the details, resources and errors containers with the
+		result rather than copying them.
+
+		Returns:
+		    Mapping: The workflow result as a read-only mapping.
+
+		"""
+		return MappingProxyType(self.to_dict())
+
 	def to_json(self, pretty: bool = False) -> str:
 		"""
 		Convert the workflow result to a JSON string.
@@ -142,8 +217,7 @@ class WorkflowResult:
 		    str: The workflow result as a JSON string.
 
 		"""
-		indent = 2 if pretty else None
-		return json.dumps(self.to_dict(), indent=indent, default=str)
+		return dumps(self.to_dict(), pretty=pretty)
 
 	def save_to_file(self, file_path: str, pretty: bool = True) -> str:
 		"""
@@ -157,8 +231,8 @@ class WorkflowResult:
 		    str: The file path.
 
 		"""
-		with open(file_path, 'w') as f:
-			f.write(self.to_json(pretty=pretty))
+		with open(file_path, 'wb') as f:
+			f.write(dumps_bytes(self.to_dict(), pretty=pretty))
 
 		return file_path
 
@@ -194,7 +268,7 @@ class WorkflowResult:
 		    WorkflowResult: The created workflow result.
 
 		"""
-		return cls.from_dict(json.loads(json_str))
+		return cls.from_dict(loads(json_str))
 
 	@classmethod
 	def from_file(cls, file_path: str) -> 'WorkflowResult':
@@ -208,8 +282,13 @@ class WorkflowResult:
 		    WorkflowResult: The created workflow result.
 
 		"""
-		with open(file_path) as f:
-			return cls.from_json(f.read())
+		with open(file_path, 'rb') as f:
+			# Map large files instead of reading them into a second buffer
+			if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+				return cls.from_dict(loads(f.read()))
+
+			with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+				return cls.from_dict(loads(memoryview(mm)))
 
 	@classmethod
 	def create_error(
@@ -287,7 +366,7 @@ class BaseWorkflow(ABC):
 			return result
 
 		except OICError as e:
-			self.logger.error(f'{error_message}: {e!s}')
+			self.logger.error('%s: %s', error_message, e)
 			result.add_error(error_message, e, resource_id)
 			return result
 
@@ -302,17 +381,23 @@ class BaseWorkflow(ABC):
 		check_result: Callable,
 		max_attempts: int = 30,
 		interval_seconds: int = 10,
+		max_interval_seconds: int = 60,
 		**kwargs,
 	) -> WorkflowResult:
 		"""
 		Wait for an operation to complete.
 
+		Polls with truncated exponential backoff and jitter, starting at
+		interval_seconds and capped at max_interval_seconds. The total wait is
+		limited to max_attempts * interval_seconds.
+
 		Args:
 		    check_operation: The operation to execute to check status.
 		    check_result: A function that takes the result of check_operation
 		        and returns True if the operation is complete.
 		    max_attempts: Maximum number of attempts.
-		    interval_seconds: Interval between attempts in seconds.
+		    interval_seconds: Initial interval between attempts in seconds.
+		    max_interval_seconds: Maximum interval between attempts in seconds.
 		    **kwargs: Additional arguments to pass to check_operation.
 
 		Returns:
@@ -320,34 +405,93 @@ class BaseWorkflow(ABC):
 
 		"""
 		result = WorkflowResult()
+		budget = max_attempts * interval_seconds
+		start = time.monotonic()
+		attempts = 0
 
-		for attempt in range(max_attempts):
+		while attempts < max_attempts:
+			attempts += 1
 			try:
 				check_result_data = check_operation(**kwargs)
 
 				if check_result(check_result_data):
-					result.details['attempts'] = attempt + 1
+					result.details['attempts'] = attempts
 					result.details['completed'] = True
+					result.details['elapsed_seconds'] = time.monotonic() - start
 					return result
 
 			except OICError as e:
-				self.logger.warning(f'Error checking operation status: {e!s}')
+				self.logger.warning('Error checking operation status: %s', e)
 				# Continue trying rather than failing immediately
 
-			# Not complete yet, wait and try again
+			remaining = budget - (time.monotonic() - start)
+			if attempts >= max_attempts or remaining <= 0:
+				break
+
+			# Not complete yet, back off and try again
+			delay = min(
+				interval_seconds * (2 ** min(attempts - 1, 5)), max_interval_seconds
+			)
+			delay = min(delay * random.uniform(0.5, 1.5), remaining)
 			self.logger.debug(
-				f'Operation not complete, waiting {interval_seconds}s (attempt {attempt + 1}/{max_attempts})'
+				f'Operation not complete, waiting {delay:.1f}s (attempt {attempts}/{max_attempts})'
 			)
-			time.sleep(interval_seconds)
+			time.sleep(delay)
 
 		# If we get here, the operation didn't complete in time
 		result.success = False
 		result.message = 'Operation did not complete in the allotted time'
-		result.details['attempts'] = max_attempts
+		result.details['attempts'] = attempts
 		result.details['completed'] = False
+		result.details['elapsed_seconds'] = time.monotonic() - start
 		result.add_error('Timeout waiting for operation to complete')
 		return result
 
+	def _wait_for_integration_status(
+		self,
+		integration_id: str,
+		status: str,
+		wait_time: float,
+		response: Optional[Dict[str, Any]] = None,
+	) -> Optional[str]:
+		"""
+		Poll an integration until it reaches a status, backing off between polls.
+
+		Polling stops as soon as the status is observed or wait_time elapses.
+
+		Args:
+		    integration_id: ID of the integration to poll.
+		    status: The status to wait for.
+		    wait_time: Maximum time to wait in seconds. With 0 the integration
+		        is checked once.
+		    response: Optional response of the status change request. Polling
+		        is skipped if it already reports the status.
+
+		Returns:
+		    Optional[str]: The last status observed, or None if it could not
+		        be read.
+
+		"""
+		if isinstance(response, dict) and response.get('status') == status:
+			return status
+
+		observed = {}
+
+		def check_status() -> Optional[str]:
+			observed['status'] = self.client.integrations.get(integration_id).get(
+				'status'
+			)
+			return observed['status']
+
+		self.wait_for_operation(
+			check_operation=check_status,
+			check_result=lambda current: current == status,
+			max_attempts=max(1, int(wait_time / _STATUS_POLL_INTERVAL)),
+			interval_seconds=_STATUS_POLL_INTERVAL,
+			max_interval_seconds=_STATUS_POLL_MAX_INTERVAL,
+		)
+		return observed.get('status')
+
 	@abstractmethod
 	def execute(self, *args, **kwargs) -> WorkflowResult:
 		"""
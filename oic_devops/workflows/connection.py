@@ -4,12 +4,130 @@ Connection workflows module for the OIC DevOps package.
 This module provides workflow operations for managing connections.
 """
 
+import json
+import logging
+import re
 import time
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from oic_devops.client import OICClient
 from oic_devops.exceptions import OICError
 from oic_devops.workflows.base import BaseWorkflow, WorkflowResult
 
+# Cached connection details expire this long after being fetched...
+_CONNECTION_CACHE_TTL = 3 * 60 * 60
+# ...or after going this long without being read
+_CONNECTION_CACHE_IDLE = 60 * 60
+
+# Values the API returns in place of secrets it does not disclose
+_MASKED_VALUE_RE = re.compile(r'^\*+$')
+
+# Integrations listed for dependency lookups are reused for this long
+_CONNECTION_INDEX_TTL = 5 * 60
+
+
+def _is_unchanged(
+	current: Dict[str, Any],
+	update: Dict[str, Any],
+	property_indexes: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> bool:
+	"""
+	Check whether applying an update to a connection would change nothing.
+
+	Lists of properties are matched by propertyName. Any value missing or
+	masked in the current connection counts as a change, since write-only
+	values cannot be compared.
+
+	Args:
+	    current: The connection as returned by the API.
+	    update: The update that would be sent.
+	    property_indexes: Optional cache of the current properties by
+	        propertyName for each property list, filled in as lists are used.
+
+	Returns:
+	    bool: True if every value in the update matches the current connection.
+
+	"""
+	for key, value in update.items():
+		if key not in current:
+			return False
+
+		if isinstance(value, list) and all(
+			isinstance(item, dict) and 'propertyName' in item for item in value
+		):
+			existing = (
+				property_indexes.get(key) if property_indexes is not None else None
+			)
+			if existing is None:
+				existing = {
+					item.get('propertyName'): item
+					for item in current[key] or []
+					if isinstance(item, dict)
+				}
+				if property_indexes is not None:
+					property_indexes[key] = existing
+			for item in value:
+				stored = existing.get(item['propertyName'])
+				if stored is None or not _is_unchanged(stored, item):
+					return False
+			continue
+
+		stored = current[key]
+		if stored is None or (
+			isinstance(stored, str) and _MASKED_VALUE_RE.match(stored)
+		):
+			return False
+		if json.dumps(stored, sort_keys=True, default=str) != json.dumps(
+			value, sort_keys=True, default=str
+		):
+			return False
+
+	return True
+
+
+def _changed_fields(
+	current: Dict[str, Any],
+	update: Dict[str, Any],
+	property_indexes: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+	"""
+	Get the top-level fields of an update that would change a connection.
+
+	A property list is kept whole when any of its properties changes.
+
+	Args:
+	    current: The connection as returned by the API.
+	    update: The update that would be sent.
+	    property_indexes: Optional cache of the current properties by
+	        propertyName for each property list, see _is_unchanged.
+
+	Returns:
+	    Dict: The fields of the update that differ from the connection.
+
+	"""
+	return {
+		key: value
+		for key, value in update.items()
+		if not _is_unchanged(current, {key: value}, property_indexes)
+	}
+
+
+def _is_test_success(test_result: Dict[str, Any]) -> bool:
+	"""
+	Check whether a connection test succeeded.
+
+	The outcome may be reported as either status or state.
+
+	Args:
+	    test_result: The response of the connection test.
+
+	Returns:
+	    bool: True if the test succeeded.
+
+	"""
+	return 'SUCCESS' in (test_result.get('status'), test_result.get('state'))
+
 
 class ConnectionWorkflows(BaseWorkflow):
 	"""
@@ -20,6 +138,39 @@ class ConnectionWorkflows(BaseWorkflow):
 	integrations.
 	"""
 
+	# Method names for the operations accepted by execute
+	_OPERATIONS = {
+		'update_credentials': 'update_credentials',
+		'test_all': 'test_all_connections',
+		'find_dependents': 'find_dependent_integrations',
+		'update_and_restart': 'update_credentials_and_restart_integrations',
+		'rotate_bulk': 'rotate_credentials_bulk',
+	}
+
+	def __init__(self, client: OICClient, logger: Optional[logging.Logger] = None):
+		"""
+		Initialize the workflow.
+
+		Args:
+		    client: The OIC client to use for API operations.
+		    logger: Optional logger to use for logging.
+
+		"""
+		super().__init__(client, logger)
+
+		# Integrations grouped by connection ID, keyed by check_active_only,
+		# as (fetched_at, integrations, positions)
+		self._connection_index: Dict[bool, Tuple[float, Any, Dict[str, Any]]] = {}
+
+		# Connection details by ID, as (fetched_at, last_read_at, connection)
+		self._connection_cache: Dict[str, Tuple[float, float, Dict[str, Any]]] = {}
+
+		# Property lists of cached connections keyed by propertyName, as
+		# (connection, {section: {propertyName: property}})
+		self._property_indexes: Dict[
+			str, Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]
+		] = {}
+
 	def execute(self, *args, **kwargs) -> WorkflowResult:
 		"""
 		Execute the specified connection workflow.
@@ -37,14 +188,10 @@ class ConnectionWorkflows(BaseWorkflow):
 		"""
 		operation = kwargs.pop('operation', None)
 
-		if operation == 'update_credentials':
-			return self.update_credentials(**kwargs)
-		if operation == 'test_all':
-			return self.test_all_connections(**kwargs)
-		if operation == 'find_dependents':
-			return self.find_dependent_integrations(**kwargs)
-		if operation == 'update_and_restart':
-			return self.update_credentials_and_restart_integrations(**kwargs)
+		method_name = self._OPERATIONS.get(operation)
+		if method_name is not None:
+			return getattr(self, method_name)(**kwargs)
+
 		result = WorkflowResult(
 			success=False, message=f'Unknown connection workflow operation: {operation}'
 		)
@@ -56,6 +203,7 @@ class ConnectionWorkflows(BaseWorkflow):
 		connection_id: str,
 		security_properties: dict,
 		test_connection: bool = True,
+		skip_unchanged: bool = False,
 		**kwargs,
 	) -> WorkflowResult:
 		"""
@@ -84,6 +232,10 @@ class ConnectionWorkflows(BaseWorkflow):
 		        Keys depend on the connection type but typically include
 		        'password', 'securityToken', etc.
 		    test_connection: Whether to test the connection after updating.
+		    skip_unchanged: Whether to compare the values with the stored
+		        connection first, sending only the fields that change and
+		        skipping the update and test if none do. Values the API does
+		        not return, such as passwords, always count as changed.
 		    **kwargs: connected to update function
 
 		Returns:
@@ -92,37 +244,70 @@ class ConnectionWorkflows(BaseWorkflow):
 		"""
 		result = WorkflowResult()
 		result.message = f'Updating credentials for connection {connection_id}'
-		self.logger.info(f'Updating {connection_id} security properties')
+		self.logger.info('Updating %s security properties', connection_id)
+
+		if skip_unchanged:
+			try:
+				current = self._cached_get(connection_id)
+			except OICError as e:
+				self.logger.warning(
+					'Failed to get connection %s, updating anyway: %s', connection_id, e
+				)
+				current = None
+
+			if current is not None:
+				security_properties = _changed_fields(
+					current,
+					security_properties,
+					self._get_property_indexes(connection_id, current),
+				)
+				if not security_properties:
+					self.logger.info('No change for %s, skipping update', connection_id)
+					result.message = f'No change for {connection_id}'
+					result.details['skipped'] = True
+					return result
 
 		try:
-			self.client.connections.update(connection_id, security_properties, **kwargs)
+			response = self.client.connections.update(
+				connection_id, security_properties, **kwargs
+			)
+			cached = self._connection_cache.get(connection_id)
+			connection_name = cached[2].get('name') if cached else None
+			self.invalidate_connection(connection_id)
+			if isinstance(response, dict) and response.get('id') == connection_id:
+				# The update answers with the stored connection, keep it rather
+				# than fetching it again
+				now = time.monotonic()
+				self._connection_cache[connection_id] = (now, now, response)
+				connection_name = response.get('name', connection_name)
 			result.add_resource(
 				'connection',
 				connection_id,
-				{'updated_information': security_properties},
+				{
+					'name': connection_name or 'Unknown',
+					'updated_information': security_properties,
+				},
 			)
-			self.logger.info(f'Updated {connection_id} security properties')
+			self.logger.info('Updated %s security properties', connection_id)
 			result.success = True
 		except Exception as e:
-			self.logger.error(f'Failed to update credential values: {e!s}')
+			self.logger.error('Failed to update credential values: %s', e)
 			result.add_error('Failed to update credential values', e, connection_id)
 			return result
 
 		if test_connection:
 			try:
-				self.logger.info(f'Testing connection {connection_id}')
+				self.logger.info('Testing connection %s', connection_id)
 				test_result = self.client.connections.test(connection_id)
 
 				# Check test result
-				if (
-					test_result.get('status') == 'SUCCESS'
-					or test_result.get('state') == 'SUCCESS'
-				):
+				if _is_test_success(test_result):
 					result.details['test_result'] = {'status': 'success'}
-					self.logger.info(f'Connection test successful for {connection_id}')
+					self.logger.info('Connection test successful for %s', connection_id)
 				else:
 					error_msg = test_result.get('message', 'Unknown test failure')
-					self.logger.error(f'Connection test failed: {error_msg}')
+					self.logger.error('Connection test failed: %s', error_msg)
+					self.invalidate_connection(connection_id)
 					result.success = False
 					result.message = f'Credentials updated but test failed: {error_msg}'
 					result.add_error(
@@ -134,7 +319,8 @@ class ConnectionWorkflows(BaseWorkflow):
 					}
 
 			except OICError as e:
-				self.logger.error(f'Failed to test connection {connection_id}: {e!s}')
+				self.logger.error('Failed to test connection %s: %s', connection_id, e)
+				self.invalidate_connection(connection_id)
 				result.success = False
 				result.message = 'Credentials updated but test failed'
 				result.add_error('Failed to test connection', e, connection_id)
@@ -143,13 +329,22 @@ class ConnectionWorkflows(BaseWorkflow):
 		return result
 
 	def test_all_connections(
-		self, continue_on_error: bool = True, **kwargs
+		self,
+		continue_on_error: bool = True,
+		max_workers: Optional[int] = None,
+		**kwargs,
 	) -> WorkflowResult:
 		"""
 		Test all connections or a filtered subset of connections.
 
+		Connection tests are run concurrently since each one is a blocking
+		REST call.
+
 		Args:
 		    continue_on_error: Whether to continue testing if some tests fail.
+		    max_workers: Maximum number of connections to test at once, never
+		        more than the client's HTTP connection pool size. Defaults to
+		        the pool size, so raising pool_maxsize raises concurrency.
 		    **kwargs are for list_all
 
 		Returns:
@@ -159,98 +354,123 @@ class ConnectionWorkflows(BaseWorkflow):
 		result = WorkflowResult()
 		result.message = 'Testing connections'
 
-		# Get list of connections
-		try:
-			connections = self.client.connections.list_all(**kwargs)
-			result.details['connection_count'] = len(connections)
-			self.logger.info(f'Found {len(connections)} connections to test')
-
-		except OICError as e:
-			self.logger.error(f'Failed to get connections list: {e!s}')
-			result.add_error('Failed to get connections list', e)
-			return result
-
-		# Test each connection
+		# Start testing connections while later pages are still being listed.
+		# More threads than pooled HTTP connections would only queue up or
+		# open connections that are thrown away afterwards.
+		pool_maxsize = self.client.config.pool_maxsize
+		executor = ThreadPoolExecutor(
+			max_workers=min(max_workers or pool_maxsize, pool_maxsize)
+		)
+		futures = {}
+		connection_count = 0
 		success_count = 0
 		failed_connections = []
+		# Test outcomes by connection ID, added to the result in one go
+		tested = {}
 
-		for connection in connections:
-			connection_id = connection.get('id')
-			connection_name = connection.get('name', 'Unknown')
-
-			if not connection_id:
-				self.logger.warning(
-					f'Skipping connection with no ID: {connection_name}'
-				)
-				continue
+		try:
+			try:
+				for connection in self.client.connections.iter_all(**kwargs):
+					connection_count += 1
+					self.expire_changed_connections((connection,))
 
-			self.logger.info(f'Testing connection {connection_name} ({connection_id})')
+					connection_id = connection.get('id')
+					connection_name = connection.get('name', 'Unknown')
 
-			# test
-			try:
-				test_result = self.client.connections.test(connection_id)
+					if not connection_id:
+						self.logger.warning(
+							'Skipping connection with no ID: %s', connection_name
+						)
+						continue
 
-				# Check if test was successful
-				if (
-					test_result.get('status') == 'SUCCESS'
-					or test_result.get('state') == 'SUCCESS'
-				):
 					self.logger.info(
-						f'Connection test successful for {connection_name}'
-					)
-					success_count += 1
-					result.add_resource(
-						'connection',
-						connection_id,
-						{'name': connection_name, 'test_result': 'success'},
+						'Testing connection %s (%s)', connection_name, connection_id
 					)
-				else:
-					error_msg = test_result.get('message', 'Unknown test failure')
-					self.logger.error(
-						f'Connection test failed for {connection_name}: {error_msg}'
+					future = executor.submit(
+						self.client.connections.test, connection_id
 					)
-					failed_connections.append(
-						{
-							'id': connection_id,
+					futures[future] = (connection_id, connection_name)
+
+			except OICError as e:
+				self.logger.error(f'Failed to get connections list: {e!s}')
+				result.add_error('Failed to get connections list', e)
+				return result
+
+			result.details['connection_count'] = connection_count
+			self.logger.info(f'Found {connection_count} connections to test')
+
+			# Collect test results. Only this thread records them, so the
+			# counters and lists need no locking.
+			for future in as_completed(futures):
+				connection_id, connection_name = futures[future]
+
+				try:
+					test_result = future.result()
+
+					# Check if test was successful
+					if _is_test_success(test_result):
+						self.logger.info(
+							'Connection test successful for %s', connection_name
+						)
+						success_count += 1
+						tested[connection_id] = {
 							'name': connection_name,
-							'error': error_msg,
+							'test_result': 'success',
 						}
-					)
-					result.add_resource(
-						'connection',
-						connection_id,
-						{
+					else:
+						error_msg = test_result.get('message', 'Unknown test failure')
+						self.logger.error(
+							'Connection test failed for %s: %s',
+							connection_name,
+							error_msg,
+						)
+						failed_connections.append(
+							{
+								'id': connection_id,
+								'name': connection_name,
+								'error': error_msg,
+							}
+						)
+						tested[connection_id] = {
 							'name': connection_name,
 							'test_result': 'failure',
 							'error': error_msg,
-						},
+						}
+
+						if not continue_on_error:
+							result.success = False
+							result.message = (
+								f'Connection test failed for {connection_name}'
+							)
+							result.add_error(
+								f'Connection test failed: {error_msg}',
+								resource_id=connection_id,
+							)
+							break
+
+				except OICError as e:
+					self.logger.error(
+						'Error testing connection %s: %s', connection_name, e
+					)
+					failed_connections.append(
+						{'id': connection_id, 'name': connection_name, 'error': str(e)}
 					)
+					tested[connection_id] = {
+						'name': connection_name,
+						'test_result': 'error',
+						'error': str(e),
+					}
 
 					if not continue_on_error:
 						result.success = False
-						result.message = f'Connection test failed for {connection_name}'
-						result.add_error(
-							f'Connection test failed: {error_msg}',
-							resource_id=connection_id,
-						)
+						result.message = f'Error testing connection {connection_name}'
+						result.add_error('Error testing connection', e, connection_id)
 						break
+		finally:
+			# Drop tests that have not started yet if we stopped early
+			executor.shutdown(wait=True, cancel_futures=True)
 
-			except OICError as e:
-				self.logger.error(f'Error testing connection {connection_name}: {e!s}')
-				failed_connections.append(
-					{'id': connection_id, 'name': connection_name, 'error': str(e)}
-				)
-				result.add_resource(
-					'connection',
-					connection_id,
-					{'name': connection_name, 'test_result': 'error', 'error': str(e)},
-				)
-
-				if not continue_on_error:
-					result.success = False
-					result.message = f'Error testing connection {connection_name}'
-					result.add_error('Error testing connection', e, connection_id)
-					break
+		result.add_resources('connection', tested)
 
 		# Update result message and details
 		if result.success:
@@ -267,41 +487,34 @@ class ConnectionWorkflows(BaseWorkflow):
 		return result
 
 	def find_dependent_integrations(
-		self, connection_id: str, check_active_only: bool = False
+		self, connection_id: str, check_active_only: bool = False, refresh: bool = False
 	) -> WorkflowResult:
 		"""
 		Find all integrations that depend on a specific connection.
 
 		This workflow:
-		1. Gets all integrations
-		2. Checks each integration for references to the connection
+		1. Gets all integrations (cached for a few minutes, see build_connection_index)
+		2. Looks up the integrations that reference the connection
 		3. Returns a list of dependent integrations
 
 		Args:
 		    connection_id: ID of the connection to check for dependencies.
 		    check_active_only: Whether to check only active integrations.
+		    refresh: Whether to re-fetch integrations instead of using the cached index.
 
 		Returns:
-		    WorkflowResult: The workflow execution result with dependent integrations.
+		    WorkflowResult: The workflow execution result with dependent integrations,
+		        one row per endpoint that uses this connection.
 
 		"""
 		result = WorkflowResult()
 		result.success = False
 
-		params = {}
-		if check_active_only:
-			params['status'] = 'ACTIVATED'
-
 		try:
-			integrations = self.client.integrations.df(params=params)
-			integrations.columns = [
-				f'integration_{x}'
-				if 'connection' not in x and 'integration' not in x
-				else x
-				for x in integrations.columns
-			]
-
-			integrations = integrations[integrations['connection_id'] == connection_id]
+			integrations, positions = self._get_connection_index(
+				check_active_only, refresh
+			)
+			integrations = integrations.iloc[positions.get(connection_id, [])]
 
 			result.success = True
 			result.add_resource('connection', connection_id, integrations)
@@ -315,6 +528,183 @@ class ConnectionWorkflows(BaseWorkflow):
 			result.add_error(f'Failed to identify integrations: {e}')
 			return result
 
+	def build_connection_index(
+		self, check_active_only: bool = False, refresh: bool = False
+	) -> Dict[str, Set[str]]:
+		"""
+		Map each connection ID to the IDs of the integrations that use it.
+
+		Integrations are listed once and the result is cached on the workflow
+		for a few minutes, so repeated dependency lookups do not hit the API
+		again.
+
+		Args:
+		    check_active_only: Whether to include only active integrations.
+		    refresh: Whether to re-fetch integrations instead of using the cache.
+
+		Returns:
+		    Dict[str, Set[str]]: Integration IDs keyed by connection ID.
+
+		"""
+		integrations, positions = self._get_connection_index(check_active_only, refresh)
+		if not positions:
+			return {}
+
+		integration_ids = integrations['integration_id']
+		return {
+			connection_id: set(integration_ids.iloc[rows])
+			for connection_id, rows in positions.items()
+		}
+
+	def _get_connection_index(
+		self, check_active_only: bool, refresh: bool
+	) -> Tuple[Any, Dict[str, Any]]:
+		"""
+		Get the integrations DataFrame with its rows grouped by connection ID.
+
+		Args:
+		    check_active_only: Whether to include only active integrations.
+		    refresh: Whether to re-fetch integrations instead of using the cache.
+
+		Returns:
+		    Tuple: The integrations DataFrame, one row per integration endpoint,
+		        and the row positions for each connection ID.
+
+		"""
+		now = time.monotonic()
+		cached = self._connection_index.get(check_active_only)
+		if (
+			not refresh
+			and cached is not None
+			and now - cached[0] < _CONNECTION_INDEX_TTL
+		):
+			return cached[1], cached[2]
+
+		full = self._connection_index.get(False)
+		if (
+			check_active_only
+			and not refresh
+			and full is not None
+			and now - full[0] < _CONNECTION_INDEX_TTL
+		):
+			# Filter the full listing we already have rather than listing
+			# the active integrations again
+			fetched_at, integrations, _ = full
+			if not integrations.empty:
+				integrations = integrations[
+					integrations['integration_status'] == 'ACTIVATED'
+				]
+		else:
+			params = {}
+			if check_active_only:
+				params['status'] = 'ACTIVATED'
+
+			fetched_at = now
+			integrations = self.client.integrations.df(explode=True, params=params)
+			columns = integrations.columns
+			integrations.columns = columns.where(
+				columns.str.contains('connection|integration'), 'integration_' + columns
+			)
+		positions = (
+			integrations.groupby('connection_id').indices
+			if not integrations.empty
+			else {}
+		)
+
+		self._connection_index[check_active_only] = (
+			fetched_at,
+			integrations,
+			positions,
+		)
+		return integrations, positions
+
+	def invalidate_connection(self, connection_id: str) -> None:
+		"""
+		Drop a connection from the connection details cache.
+
+		Args:
+		    connection_id: ID of the connection to drop.
+
+		"""
+		self._connection_cache.pop(connection_id, None)
+		self._property_indexes.pop(connection_id, None)
+
+	def expire_changed_connections(self, connections: Iterable[Dict[str, Any]]) -> int:
+		"""
+		Drop cached connections that a listing shows were changed since.
+
+		Cached connections are compared by their lastUpdated timestamp, which
+		catches changes made outside this workflow without fetching each one.
+
+		Args:
+		    connections: Connections as returned by the connections listing.
+
+		Returns:
+		    int: The number of cached connections dropped.
+
+		"""
+		expired = 0
+		for connection in connections:
+			connection_id = connection.get('id')
+			cached = self._connection_cache.get(connection_id)
+			if cached is None:
+				continue
+
+			if cached[2].get('lastUpdated') != connection.get('lastUpdated'):
+				self.invalidate_connection(connection_id)
+				expired += 1
+
+		return expired
+
+	def _get_property_indexes(
+		self, connection_id: str, connection: Dict[str, Any]
+	) -> Dict[str, Dict[str, Any]]:
+		"""
+		Get the property lookup cache for a cached connection.
+
+		The cache is reset whenever the connection is fetched again.
+
+		Args:
+		    connection_id: ID of the connection.
+		    connection: The connection data the lookups are built from.
+
+		Returns:
+		    Dict: Properties by propertyName, keyed by section.
+
+		"""
+		cached = self._property_indexes.get(connection_id)
+		if cached is None or cached[0] is not connection:
+			cached = (connection, {})
+			self._property_indexes[connection_id] = cached
+		return cached[1]
+
+	def _cached_get(self, connection_id: str) -> Dict[str, Any]:
+		"""
+		Get a connection, reusing a recently fetched copy when available.
+
+		Args:
+		    connection_id: ID of the connection to get.
+
+		Returns:
+		    Dict: The connection data.
+
+		"""
+		now = time.monotonic()
+		cached = self._connection_cache.get(connection_id)
+
+		if cached is not None:
+			fetched_at, last_read_at, connection = cached
+			if (
+				now - fetched_at < _CONNECTION_CACHE_TTL
+				and now - last_read_at < _CONNECTION_CACHE_IDLE
+			):
+				self._connection_cache[connection_id] = (fetched_at, now, connection)
+				return connection
+
+		connection = self.client.connections.get(connection_id, raw=True)
+		self._connection_cache[connection_id] = (now, now, connection)
+		return connection
+
 	def update_credentials_and_restart_integrations(
 		self,
 		connection_id: str,
@@ -323,6 +713,7 @@ class ConnectionWorkflows(BaseWorkflow):
 		sequential_restart: bool = True,
 		verify_restart: bool = True,
 		wait_time: int = 20,
+		max_workers: int = 8,
 	) -> WorkflowResult:
 		"""
 		Update connection credentials and restart dependent integrations.
@@ -337,8 +728,12 @@ class ConnectionWorkflows(BaseWorkflow):
 		    credentials: Dict containing credential fields to update.
 		    restart_scope: Which integrations to restart: "all", "active", or "none".
 		    sequential_restart: Whether to restart integrations one at a time.
-		    verify_restart: Whether to verify integrations are active after restart.
-		    wait_time: Time to wait between operations in seconds.
+		        Otherwise integrations are restarted concurrently.
+		    verify_restart: Whether to fail restarts of integrations that are not
+		        active after restart.
+		    wait_time: Maximum time to wait for each status change in seconds.
+		    max_workers: Maximum number of integrations to restart at once when
+		        not restarting sequentially.
 
 		Returns:
 		    WorkflowResult: The workflow execution result.
@@ -390,30 +785,7 @@ class ConnectionWorkflows(BaseWorkflow):
 		dependent_result_output = dependent_result.resources['connection'][
 			connection_id
 		]
-		dependent_result_output = dependent_result_output[
-			dependent_result_output['connection_id'] == connection_id
-		]
-		current_versions = (
-			dependent_result_output.sort_values(
-				by='integration_version', ascending=False
-			)
-			.groupby('integration_name')[['integration_id', 'integration_version']]
-			.first()
-			.reset_index()
-		)
-		dependent_result_output = dependent_result_output[
-			dependent_result_output['integration_id'].isin(
-				current_versions['integration_id']
-			)
-		][
-			[
-				'integration_name',
-				'integration_id',
-				'integration_status',
-				'integration_pattern',
-				'integration_version',
-			]
-		].drop_duplicates()
+		restarts = self._select_restarts(dependent_result_output)
 
 		# Merge results
 		result.merge(dependent_result)
@@ -423,125 +795,361 @@ class ConnectionWorkflows(BaseWorkflow):
 			self.logger.warning('Error finding dependent integrations, but continuing')
 
 		# If no integrations to restart, we're done
-		if len(dependent_result_output) == 0:
+		if not restarts:
 			self.logger.info('No integrations to restart')
 			result.message = f'Successfully updated credentials for connection {connection_name}, no integrations to restart'
 			return result
 
 		# Step 4: Restart each integration
-		successful_restarts = []
-		failed_restarts = []
+		self.logger.info(f'Restarting {len(restarts)} integrations')
+		successful_restarts, failed_restarts = self._record_restarts(
+			result,
+			self._run_restarts(
+				restarts, sequential_restart, verify_restart, wait_time, max_workers
+			),
+		)
+		# Restarts change integration statuses, so the cached listing is stale
+		self._connection_index.clear()
 
-		for index, integration in dependent_result_output.iterrows():
-			self.logger.info(
-				f'Restarting {len(integration["integration_id"])} integrations'
+		# Update overall workflow status
+		if failed_restarts:
+			result.success = False
+			result.message = (
+				f'Updated credentials for connection {connection_name}, '
+				f'but {len(failed_restarts)} of {len(restarts)} integration restarts failed'
+			)
+		else:
+			result.message = (
+				f'Successfully updated credentials for connection {connection_name} '
+				f'and restarted {len(successful_restarts)} integrations'
 			)
 
-			integration_id = integration['integration_id']
-			integration_name = integration['integration_name']
-			current_status = integration['integration_status']
-			integration_scheduled = integration['integration_pattern'] == 'Scheduled'
+		return result
+
+	def rotate_credentials_bulk(
+		self,
+		credentials: Dict[str, Dict[str, Any]],
+		restart_scope: str = 'all',  # "all", "active", "none"
+		sequential_restart: bool = False,
+		verify_restart: bool = True,
+		wait_time: int = 20,
+		max_workers: int = 8,
+	) -> WorkflowResult:
+		"""
+		Update credentials for several connections and restart their dependents.
+
+		This workflow:
+		1. Updates and tests the credentials of all connections concurrently
+		2. Finds the integrations that depend on any updated connection, listing
+		   integrations only once
+		3. Restarts each of those integrations once, however many of the
+		   updated connections it uses
+
+		Args:
+		    credentials: Credential fields to update, keyed by connection ID.
+		    restart_scope: Which integrations to restart: "all", "active", or "none".
+		    sequential_restart: Whether to restart integrations one at a time.
+		        Otherwise integrations are restarted concurrently.
+		    verify_restart: Whether to fail restarts of integrations that are not
+		        active after restart.
+		    wait_time: Maximum time to wait for each status change in seconds.
+		    max_workers: Maximum number of connections to update, and of
+		        integrations to restart concurrently, at once.
+
+		Returns:
+		    WorkflowResult: The workflow execution result.
 
-			self.logger.info(
-				f'Processing integration: {integration_name} (current status: {current_status})'
+		"""
+		result = WorkflowResult()
+		result.message = f'Rotating credentials for {len(credentials)} connections'
+
+		if not credentials:
+			result.message = 'No connections to update'
+			return result
+
+		# Step 1: Update credentials
+		self.logger.info(f'Updating credentials for {len(credentials)} connections')
+		connection_ids = list(credentials)
+		with ThreadPoolExecutor(
+			max_workers=min(
+				max_workers, len(connection_ids), self.client.config.pool_maxsize
+			)
+		) as executor:
+			update_results = list(
+				executor.map(
+					lambda connection_id: self.update_credentials(
+						connection_id=connection_id,
+						security_properties=credentials[connection_id],
+						test_connection=True,
+					),
+					connection_ids,
+				)
 			)
 
-			# Only deactivate if already activated
-			deactivate_needed = current_status == 'ACTIVATED'
-			restart_success = True
-			restart_error = None
+		result.merge_many(update_results)
 
-			# Step 4a: Deactivate if needed
-			if deactivate_needed:
-				try:
-					self.logger.info(f'Deactivating integration: {integration_name}')
+		updated_connections = []
+		failed_connections = []
+		for connection_id, update_result in zip(connection_ids, update_results):
+			if update_result.success:
+				updated_connections.append(connection_id)
+			else:
+				failed_connections.append(connection_id)
 
-					if integration_scheduled:
-						self.client.integrations.deactivate(
-							integration_id, stop_schedular=True
-						)
-					else:
-						self.client.integrations.deactivate(
-							integration_id, stop_schedular=False
-						)
+		result.details['update_results'] = {
+			'successful_count': len(updated_connections),
+			'failed_count': len(failed_connections),
+			'updated_connections': updated_connections,
+			'failed_connections': failed_connections,
+		}
 
-					# Wait for deactivation to complete if sequential restart
-					if sequential_restart:
-						self.logger.info(
-							f'Waiting {wait_time}s for deactivation to complete'
-						)
-						time.sleep(wait_time)
+		# If every credential update failed, stop
+		if not updated_connections:
+			self.logger.error('All credential updates failed, stopping workflow')
+			result.message = 'Failed to update credentials, integrations not restarted'
+			return result
 
-						# Verify deactivation if requested
-						if verify_restart:
-							integration_status = self.client.integrations.get(
-								integration_id
-							)
-							if integration_status.get('status') != 'CONFIGURED':
-								self.logger.warning(
-									f'Integration {integration_name} not fully deactivated, status: {integration_status.get("status")}'
-								)
+		# Step 2: If no restart needed, we're done
+		if restart_scope == 'none':
+			result.message = (
+				f'Updated credentials for {len(updated_connections)} of '
+				f'{len(connection_ids)} connections, no integrations restarted'
+			)
+			return result
 
-				except OICError as e:
-					self.logger.error(
-						f'Failed to deactivate integration {integration_name}: {e!s}'
-					)
-					restart_success = False
-					restart_error = f'Deactivation failed: {e!s}'
+		# Step 3: Find the integrations depending on any updated connection
+		try:
+			integrations, positions = self._get_connection_index(
+				restart_scope == 'active', refresh=False
+			)
+		except OICError as e:
+			self.logger.error(f'Failed to identify integrations: {e}')
+			result.add_error('Failed to identify integrations', e)
+			result.message = (
+				'Updated credentials but failed to find integrations to restart'
+			)
+			return result
 
-			# Step 4b: Activate the integration
-			if restart_success:  # Only if deactivation succeeded or wasn't needed
-				try:
-					self.logger.info(f'Activating integration: {integration_name}')
-					self.client.integrations.activate(integration_id)
+		rows = sorted(
+			{
+				row
+				for connection_id in updated_connections
+				for row in positions.get(connection_id, ())
+			}
+		)
+		restarts = self._select_restarts(integrations.iloc[rows])
 
-					# Wait for activation to complete if sequential restart
-					if sequential_restart:
-						self.logger.info(
-							f'Waiting {wait_time}s for activation to complete'
-						)
-						time.sleep(wait_time)
+		if not restarts:
+			self.logger.info('No integrations to restart')
+			result.message = (
+				f'Updated credentials for {len(updated_connections)} of '
+				f'{len(connection_ids)} connections, no integrations to restart'
+			)
+			return result
 
-						# Verify activation if requested
-						if verify_restart:
-							integration_status = self.client.integrations.get(
-								integration_id
-							)
-							if integration_status.get('status') != 'ACTIVATED':
-								self.logger.warning(
-									f'Integration {integration_name} not fully activated, status: {integration_status.get("status")}'
-								)
-								restart_success = False
-								restart_error = f'Activation verification failed, status: {integration_status.get("status")}'
-
-						if integration_scheduled:
-							self.logger.info(
-								f'Integration {integration_name} - Resuming Schedule'
-							)
-							schedule_status = self.client.integrations.resume_schedule(
-								integration_id
-							)
-							self.logger.info(
-								f'Integration {integration_name} - Schedule Activated'
-							)
+		# Step 4: Restart each integration once
+		self.logger.info(f'Restarting {len(restarts)} integrations')
+		successful_restarts, failed_restarts = self._record_restarts(
+			result,
+			self._run_restarts(
+				restarts, sequential_restart, verify_restart, wait_time, max_workers
+			),
+		)
+		# Restarts change integration statuses, so the cached listing is stale
+		self._connection_index.clear()
 
-				except OICError as e:
-					self.logger.error(
-						f'Failed to activate integration {integration_name}: {e!s}'
+		result.message = (
+			f'Updated credentials for {len(updated_connections)} of '
+			f'{len(connection_ids)} connections and restarted '
+			f'{len(successful_restarts)} of {len(restarts)} integrations'
+		)
+		if failed_connections or failed_restarts:
+			result.success = False
+
+		return result
+
+	def _select_restarts(self, dependents: Any) -> List[Tuple[str, str, str, bool]]:
+		"""
+		Pick the integrations to restart from a set of dependent integrations.
+
+		Only the latest version of each integration is restarted, and each
+		integration is restarted once even if it uses several of the connections.
+
+		Args:
+		    dependents: DataFrame of dependent integrations, one row per
+		        integration endpoint.
+
+		Returns:
+		    List[Tuple]: The integration ID, name, current status and whether
+		        it is scheduled, for each integration to restart.
+
+		"""
+		if dependents.empty:
+			return []
+
+		# Versions are zero padded, so the latest sorts first as a string.
+		# The exploded frame repeats index labels, which rules out idxmax.
+		dependents = dependents.sort_values(
+			by='integration_version', ascending=False
+		).drop_duplicates(subset='integration_name')
+
+		return list(
+			zip(
+				dependents['integration_id'].tolist(),
+				dependents['integration_name'].tolist(),
+				dependents['integration_status'].tolist(),
+				(dependents['integration_pattern'] == 'Scheduled').tolist(),
+			)
+		)
+
+	def _run_restarts(
+		self,
+		restarts: List[Tuple[str, str, str, bool]],
+		sequential_restart: bool,
+		verify_restart: bool,
+		wait_time: int,
+		max_workers: int,
+	) -> Iterable[Tuple[Tuple[str, str, str, bool], Optional[str]]]:
+		"""
+		Restart integrations, one at a time or concurrently.
+
+		Args:
+		    restarts: The integrations to restart, see _select_restarts.
+		    sequential_restart: Whether to restart integrations one at a time.
+		    verify_restart: Whether to fail restarts of integrations that are not
+		        active after restart.
+		    wait_time: Maximum time to wait for each status change in seconds.
+		    max_workers: Maximum number of integrations to restart at once when
+		        not restarting sequentially.
+
+		Returns:
+		    Iterable: Each restart with the reason it failed, or None if it
+		        succeeded, in the order given.
+
+		"""
+		# A single restart gains nothing from a thread pool. Schedules do not
+		# hold up the next restart, so they are resumed together at the end
+		if sequential_restart or len(restarts) == 1:
+			outcomes = [
+				(
+					restart,
+					self._restart_integration(
+						*restart, verify_restart, wait_time, resume_schedule=False
+					),
+				)
+				for restart in restarts
+			]
+			return self._resume_schedules(outcomes)
+
+		# Restart integrations side by side, each one moving on as soon as
+		# its status changes rather than after a fixed wait
+		executor = ThreadPoolExecutor(
+			max_workers=min(max_workers, len(restarts), self.client.config.pool_maxsize)
+		)
+		futures = [
+			executor.submit(
+				self._restart_integration, *restart, verify_restart, wait_time
+			)
+			for restart in restarts
+		]
+		executor.shutdown(wait=False)
+		return zip(restarts, (future.result() for future in futures))
+
+	def _resume_schedules(
+		self, outcomes: List[Tuple[Tuple[str, str, str, bool], Optional[str]]]
+	) -> List[Tuple[Tuple[str, str, str, bool], Optional[str]]]:
+		"""
+		Resume the schedules of restarted integrations concurrently.
+
+		Args:
+		    outcomes: Restart outcomes, see _run_restarts.
+
+		Returns:
+		    List: The outcomes, with failed schedule resumes marked as failed
+		        restarts.
+
+		"""
+		resumes = [
+			(integration_id, integration_name)
+			for (integration_id, integration_name, _, scheduled), error in outcomes
+			if scheduled and error is None
+		]
+		if not resumes:
+			return outcomes
+
+		if len(resumes) == 1:
+			resume_errors = {resumes[0][0]: self._resume_schedule(*resumes[0])}
+		else:
+			with ThreadPoolExecutor(
+				max_workers=min(len(resumes), self.client.config.pool_maxsize)
+			) as executor:
+				resume_errors = dict(
+					zip(
+						(integration_id for integration_id, _ in resumes),
+						executor.map(self._resume_schedule, *zip(*resumes)),
 					)
-					restart_success = False
-					restart_error = f'Activation failed: {e!s}'
+				)
+
+		return [
+			(restart, error or resume_errors.get(restart[0]))
+			for restart, error in outcomes
+		]
+
+	def _resume_schedule(
+		self, integration_id: str, integration_name: str
+	) -> Optional[str]:
+		"""
+		Resume the schedule of an integration.
+
+		Args:
+		    integration_id: ID of the integration.
+		    integration_name: Name of the integration, for logging.
+
+		Returns:
+		    Optional[str]: The reason the resume failed, or None if it succeeded.
+
+		"""
+		try:
+			self.logger.info('Integration %s - Resuming Schedule', integration_name)
+			self.client.integrations.resume_schedule(integration_id)
+			self.logger.info('Integration %s - Schedule Activated', integration_name)
+		except OICError as e:
+			self.logger.error(
+				'Failed to resume schedule of integration %s: %s', integration_name, e
+			)
+			return f'Schedule resume failed: {e!s}'
+
+		return None
+
+	def _record_restarts(
+		self,
+		result: WorkflowResult,
+		outcomes: Iterable[Tuple[Tuple[str, str, str, bool], Optional[str]]],
+	) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+		"""
+		Record integration restart outcomes on a workflow result.
+
+		Args:
+		    result: The workflow result to update.
+		    outcomes: Restart outcomes, see _run_restarts.
+
+		Returns:
+		    Tuple: The successful and the failed restarts.
+
+		"""
+		successful_restarts = []
+		failed_restarts = []
+		restarted = {}
 
-			# Record the result
-			if restart_success:
+		for (integration_id, integration_name, _, _), restart_error in outcomes:
+			if restart_error is None:
 				successful_restarts.append(
 					{'id': integration_id, 'name': integration_name}
 				)
-				result.add_resource(
-					'restarted_integration',
-					integration_id,
-					{'name': integration_name, 'result': 'success'},
-				)
+				restarted[integration_id] = {
+					'name': integration_name,
+					'result': 'success',
+				}
 			else:
 				failed_restarts.append(
 					{
@@ -554,30 +1162,14 @@ class ConnectionWorkflows(BaseWorkflow):
 					f'Failed to restart integration {integration_name}',
 					resource_id=integration_id,
 				)
-				result.add_resource(
-					'restarted_integration',
-					integration_id,
-					{
-						'name': integration_name,
-						'result': 'failure',
-						'error': restart_error,
-					},
-				)
+				restarted[integration_id] = {
+					'name': integration_name,
+					'result': 'failure',
+					'error': restart_error,
+				}
 
-		# Update overall workflow status
-		if failed_restarts:
-			result.success = False
-			result.message = (
-				f'Updated credentials for connection {connection_name}, '
-				f'but {len(failed_restarts)} of {len(dependent_result_output)} integration restarts failed'
-			)
-		else:
-			result.message = (
-				f'Successfully updated credentials for connection {connection_name} '
-				f'and restarted {len(successful_restarts)} integrations'
-			)
+		result.add_resources('restarted_integration', restarted)
 
-		# Add details to the result
 		result.details['restart_results'] = {
 			'successful_count': len(successful_restarts),
 			'failed_count': len(failed_restarts),
@@ -585,4 +1177,98 @@ class ConnectionWorkflows(BaseWorkflow):
 			'failed_restarts': failed_restarts,
 		}
 
-		return result
+		return successful_restarts, failed_restarts
+
+	def _restart_integration(
+		self,
+		integration_id: str,
+		integration_name: str,
+		current_status: str,
+		integration_scheduled: bool,
+		verify_restart: bool,
+		wait_time: int,
+		resume_schedule: bool = True,
+	) -> Optional[str]:
+		"""
+		Deactivate and reactivate an integration, polling for each status change.
+
+		Each step starts as soon as the previous one is observed to finish,
+		waiting at most wait_time for it.
+
+		Args:
+		    integration_id: ID of the integration to restart.
+		    integration_name: Name of the integration, for logging.
+		    current_status: Current status of the integration.
+		    integration_scheduled: Whether the integration is scheduled.
+		    verify_restart: Whether to verify the integration is active after restart.
+		    wait_time: Maximum time to wait for each status change in seconds.
+		    resume_schedule: Whether to resume the schedule of a scheduled
+		        integration once it is active.
+
+		Returns:
+		    Optional[str]: The reason the restart failed, or None if it succeeded.
+
+		"""
+		integrations = self.client.integrations
+		logger = self.logger
+
+		logger.info(
+			'Processing integration: %s (current status: %s)',
+			integration_name,
+			current_status,
+		)
+
+		# Deactivate if needed, only if already activated
+		if current_status == 'ACTIVATED':
+			try:
+				logger.info('Deactivating integration: %s', integration_name)
+				response = integrations.deactivate(
+					integration_id, stop_schedular=integration_scheduled
+				)
+			except OICError as e:
+				logger.error(
+					'Failed to deactivate integration %s: %s', integration_name, e
+				)
+				return f'Deactivation failed: {e!s}'
+
+			if (
+				self._wait_for_integration_status(
+					integration_id, 'CONFIGURED', wait_time, response
+				)
+				!= 'CONFIGURED'
+			):
+				logger.warning(
+					'Integration %s not fully deactivated after %ss',
+					integration_name,
+					wait_time,
+				)
+
+		# Activate the integration
+		try:
+			logger.info('Activating integration: %s', integration_name)
+			response = integrations.activate(integration_id)
+
+			if (
+				self._wait_for_integration_status(
+					integration_id, 'ACTIVATED', wait_time, response
+				)
+				!= 'ACTIVATED'
+			):
+				logger.warning(
+					'Integration %s not fully activated after %ss',
+					integration_name,
+					wait_time,
+				)
+				if verify_restart:
+					return f'Activation verification failed, not ACTIVATED after {wait_time}s'
+
+			if integration_scheduled and resume_schedule:
+				logger.info('Integration %s - Resuming Schedule', integration_name)
+				integrations.resume_schedule(integration_id)
+				logger.info('Integration %s - Schedule Activated', integration_name)
+
+		except OICError as e:
+			logger.error('Failed to activate integration %s: %s', integration_name, e)
+			return f'Activation failed: {e!s}'
+
+		return None
@@ -5,13 +5,101 @@ This module provides workflow operations for deploying OIC resources
 across environments.
 """
 
-import json
+import io
+import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+import sys
+import tarfile
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from oic_devops.client import OICClient
 from oic_devops.exceptions import OICError
+from oic_devops.utils.serialization import dumps_bytes
 from oic_devops.workflows.base import BaseWorkflow, WorkflowResult
+from oic_devops.workflows.integration import IntegrationWorkflows
+
+# Temporary directories are removed even if some files cannot be deleted,
+# which TemporaryDirectory only supports from Python 3.10
+_TEMP_DIR_OPTIONS = (
+	{'ignore_cleanup_errors': True} if sys.version_info >= (3, 10) else {}
+)
+
+# Connection details fetched for export are reused for this long
+_CONNECTION_DETAILS_TTL = 5 * 60
+
+# File extension of each resource type clone_environment can clone
+_CLONE_EXTENSIONS = {
+	'connections': 'json',
+	'lookups': 'csv',
+	'libraries': 'jar',
+	'integrations': 'iar',
+}
+
+# Seconds to wait for a promoted integration to report it is activated
+_ACTIVATION_WAIT_TIME = 10
+
+
+def _query_matcher(query: Union[str, List[str]]) -> Callable[[str], bool]:
+	"""
+	Build a function telling whether a text matches a clone filter query.
+
+	Args:
+	    query: A string the text must contain, or a list of strings the text
+	        must contain one of.
+
+	Returns:
+	    Callable: Function taking the text.
+
+	"""
+	if isinstance(query, str):
+		return lambda text: query in text
+
+	if not query:
+		return lambda text: False
+
+	# Look for all alternatives in one pass rather than one scan each
+	pattern = re.compile('|'.join(map(re.escape, query)))
+	return lambda text: pattern.search(text) is not None
+
+
+def _resource_filter(
+	exclude_query: Optional[Union[str, List[str]]],
+	include_query: Optional[Union[str, List[str]]],
+) -> Callable[[Dict[str, Any]], bool]:
+	"""
+	Build a predicate telling whether a resource passes the clone filters.
+
+	A resource matches a query when its name or ID does.
+
+	Args:
+	    exclude_query: Optional query matching resources to skip.
+	    include_query: Optional query resources must match.
+
+	Returns:
+	    Callable: Predicate taking a resource.
+
+	"""
+	if exclude_query is None and include_query is None:
+		return lambda resource: True
+
+	excluded = _query_matcher(exclude_query) if exclude_query is not None else None
+	included = _query_matcher(include_query) if include_query is not None else None
+
+	def should_process_resource(resource: Dict[str, Any]) -> bool:
+		name = resource.get('name', '')
+		resource_id = resource.get('id', '')
+		if excluded is not None and (excluded(name) or excluded(resource_id)):
+			return False
+		return included is None or included(name) or included(resource_id)
+
+	return should_process_resource
 
 
 class DeploymentWorkflows(BaseWorkflow):
@@ -22,6 +110,33 @@ class DeploymentWorkflows(BaseWorkflow):
 	across environments, including export, import, and promotion operations.
 	"""
 
+	# Method names for the operations accepted by execute
+	_OPERATIONS = {
+		'export_integration': 'export_integration',
+		'import_integration': 'import_integration',
+		'promote_integration': 'promote_integration',
+		'export_package': 'export_package',
+		'import_package': 'import_package',
+		'clone_environment': 'clone_environment',
+	}
+
+	def __init__(self, client: OICClient, logger: Optional[logging.Logger] = None):
+		"""
+		Initialize the workflow.
+
+		Args:
+		    client: The OIC client to use for API operations.
+		    logger: Optional logger to use for logging.
+
+		"""
+		super().__init__(client, logger)
+
+		# Export directories already created or found by this workflow
+		self._ensured_dirs: Set[str] = set()
+
+		# Connection details by ID for exports, as (fetched_at, connection)
+		self._connection_details: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 	def execute(self, *args, **kwargs) -> WorkflowResult:
 		"""
 		Execute the specified deployment workflow.
@@ -39,18 +154,10 @@ class DeploymentWorkflows(BaseWorkflow):
 		"""
 		operation = kwargs.pop('operation', None)
 
-		if operation == 'export_integration':
-			return self.export_integration(**kwargs)
-		if operation == 'import_integration':
-			return self.import_integration(**kwargs)
-		if operation == 'promote_integration':
-			return self.promote_integration(**kwargs)
-		if operation == 'export_package':
-			return self.export_package(**kwargs)
-		if operation == 'import_package':
-			return self.import_package(**kwargs)
-		if operation == 'clone_environment':
-			return self.clone_environment(**kwargs)
+		method_name = self._OPERATIONS.get(operation)
+		if method_name is not None:
+			return getattr(self, method_name)(**kwargs)
+
 		result = WorkflowResult(
 			success=False, message=f'Unknown deployment workflow operation: {operation}'
 		)
@@ -63,6 +170,8 @@ class DeploymentWorkflows(BaseWorkflow):
 		export_file_path: str,
 		include_dependencies: bool = False,
 		overwrite: bool = False,
+		max_workers: int = 8,
+		archive_dependencies: bool = False,
 	) -> WorkflowResult:
 		"""
 		Export an integration to a file.
@@ -77,6 +186,54 @@ class DeploymentWorkflows(BaseWorkflow):
 		    export_file_path: Path to save the exported integration file.
 		    include_dependencies: Whether to export dependencies.
 		    overwrite: Whether to overwrite existing files.
+		    max_workers: Maximum number of dependencies to export at once.
+		    archive_dependencies: Whether to export dependencies to one tar
+		        archive instead of a directory with a file each.
+
+		Returns:
+		    WorkflowResult: The workflow execution result.
+
+		"""
+		result = self._export_integration_simple(
+			integration_id, export_file_path, overwrite
+		)
+
+		# Export dependencies if requested
+		if include_dependencies and result.success:
+			integration_name = result.details['integration_name']
+
+			# Build the dependency export directory
+			base_name = os.path.splitext(export_file_path)[0]
+			dep_path = f'{base_name}_dependencies'
+			if archive_dependencies:
+				dep_path += '.tar'
+
+			dependency_export = self._export_dependencies(
+				integration_id,
+				integration_name,
+				dep_path,
+				max_workers,
+				archive_dependencies,
+			)
+			result.details['dependency_export'] = dependency_export
+
+			# Update message
+			dep_total = sum(dependency_export.get('counts', {}).values())
+			if dep_total > 0:
+				result.message = f'Exported integration {integration_name} and {dep_total} dependencies'
+
+		return result
+
+	def _export_integration_simple(
+		self, integration_id: str, export_file_path: str, overwrite: bool
+	) -> WorkflowResult:
+		"""
+		Export an integration to a file, without its dependencies.
+
+		Args:
+		    integration_id: ID of the integration to export.
+		    export_file_path: Path to save the exported integration file.
+		    overwrite: Whether to overwrite existing files.
 
 		Returns:
 		    WorkflowResult: The workflow execution result.
@@ -96,9 +253,9 @@ class DeploymentWorkflows(BaseWorkflow):
 
 		# Ensure directory exists
 		export_dir = os.path.dirname(export_file_path)
-		if export_dir and not os.path.exists(export_dir):
+		if export_dir:
 			try:
-				os.makedirs(export_dir)
+				self._ensure_directory(export_dir)
 			except Exception as e:
 				result.success = False
 				result.message = f'Failed to create export directory {export_dir}'
@@ -107,7 +264,7 @@ class DeploymentWorkflows(BaseWorkflow):
 
 		# Get the integration details
 		try:
-			self.logger.info(f'Getting details for integration {integration_id}')
+			self.logger.info('Getting details for integration %s', integration_id)
 			integration = self.client.integrations.get(integration_id)
 			integration_name = integration.get('name', 'Unknown')
 
@@ -117,7 +274,7 @@ class DeploymentWorkflows(BaseWorkflow):
 			result.details['integration_name'] = integration_name
 
 		except OICError as e:
-			self.logger.error(f'Failed to get integration {integration_id}: {e!s}')
+			self.logger.error('Failed to get integration %s: %s', integration_id, e)
 			result.add_error(
 				f'Failed to get integration {integration_id}', e, integration_id
 			)
@@ -127,160 +284,25 @@ class DeploymentWorkflows(BaseWorkflow):
 		# Export the integration
 		try:
 			self.logger.info(
-				f'Exporting integration {integration_name} to {export_file_path}'
+				'Exporting integration %s to %s', integration_name, export_file_path
 			)
-			export_result = self.client.integrations.export(
+			# The export may adjust the file name, so report the actual path
+			result.details['export_file_path'] = self.client.integrations.export(
 				integration_id, export_file_path
 			)
 
-			result.details['export_file_path'] = export_file_path
-
 		except OICError as e:
-			self.logger.error(f'Failed to export integration {integration_name}: {e!s}')
+			self.logger.error(
+				'Failed to export integration %s: %s', integration_name, e
+			)
 			result.add_error(
 				f'Failed to export integration {integration_name}', e, integration_id
 			)
 			result.success = False
 			return result
 
-		# Export dependencies if requested
-		if include_dependencies:
-			self.logger.info(
-				f'Exporting dependencies for integration {integration_name}'
-			)
-
-			# Find dependencies
-			try:
-				from oic_devops.workflows.integration import IntegrationWorkflows
-
-				integration_workflows = IntegrationWorkflows(self.client)
-
-				dependency_result = integration_workflows.find_integration_dependencies(
-					integration_id=integration_id,
-					include_connections=True,
-					include_lookups=True,
-					include_libraries=True,
-				)
-
-				if not dependency_result.success:
-					self.logger.warning(
-						'Failed to find dependencies, continuing with export'
-					)
-					result.details['dependency_export'] = {
-						'status': 'failed',
-						'message': 'Failed to find dependencies',
-					}
-				else:
-					# Export each dependency
-					dep_counts = {'connections': 0, 'lookups': 0, 'libraries': 0}
-
-					# Build the dependency export directory
-					base_name = os.path.splitext(export_file_path)[0]
-					dep_dir = f'{base_name}_dependencies'
-					os.makedirs(dep_dir, exist_ok=True)
-
-					# Export connections
-					connections = dependency_result.details.get('dependencies', {}).get(
-						'connections', []
-					)
-					for connection in connections:
-						connection_id = connection.get('id')
-						connection_name = connection.get('name', 'Unknown')
-
-						if connection_id:
-							# For connections, we can only export configuration as JSON
-							try:
-								connection_details = self.client.connections.get(
-									connection_id
-								)
-								conn_file_path = os.path.join(
-									dep_dir, f'connection_{connection_id}.json'
-								)
-
-								with open(conn_file_path, 'w') as f:
-									json.dump(connection_details, f, indent=2)
-
-								dep_counts['connections'] += 1
-								self.logger.info(
-									f'Exported connection {connection_name} to {conn_file_path}'
-								)
-							except Exception as e:
-								self.logger.warning(
-									f'Failed to export connection {connection_name}: {e!s}'
-								)
-
-					# Export lookups
-					lookups = dependency_result.details.get('dependencies', {}).get(
-						'lookups', []
-					)
-					for lookup in lookups:
-						lookup_id = lookup.get('id')
-						lookup_name = lookup.get('name', 'Unknown')
-
-						if lookup_id:
-							try:
-								lookup_file_path = os.path.join(
-									dep_dir, f'lookup_{lookup_id}.csv'
-								)
-								self.client.lookups.export(lookup_id, lookup_file_path)
-								dep_counts['lookups'] += 1
-								self.logger.info(
-									f'Exported lookup {lookup_name} to {lookup_file_path}'
-								)
-							except Exception as e:
-								self.logger.warning(
-									f'Failed to export lookup {lookup_name}: {e!s}'
-								)
-
-					# Export libraries
-					libraries = dependency_result.details.get('dependencies', {}).get(
-						'libraries', []
-					)
-					for library in libraries:
-						library_id = library.get('id')
-						library_name = library.get('name', 'Unknown')
-
-						if library_id:
-							try:
-								library_file_path = os.path.join(
-									dep_dir, f'library_{library_id}.jar'
-								)
-								self.client.libraries.export(
-									library_id, library_file_path
-								)
-								dep_counts['libraries'] += 1
-								self.logger.info(
-									f'Exported library {library_name} to {library_file_path}'
-								)
-							except Exception as e:
-								self.logger.warning(
-									f'Failed to export library {library_name}: {e!s}'
-								)
-
-					# Update result with dependency export information
-					result.details['dependency_export'] = {
-						'status': 'success',
-						'directory': dep_dir,
-						'counts': dep_counts,
-					}
-
-					# Update message
-					dep_total = sum(dep_counts.values())
-					if dep_total > 0:
-						result.message = f'Exported integration {integration_name} and {dep_total} dependencies'
-
-			except Exception as e:
-				self.logger.error(f'Failed to export dependencies: {e!s}')
-				result.details['dependency_export'] = {
-					'status': 'failed',
-					'message': str(e),
-				}
-				# Continue with the main export result
-
 		# Successfully exported
-		if result.message == f'Exporting integration {integration_id}':
-			result.message = f'Successfully exported integration {integration_name} to {export_file_path}'
-
+		result.message = f'Successfully exported integration {integration_name} to {result.details["export_file_path"]}'
 		return result
 
 	def import_integration(
@@ -315,6 +337,74 @@ class DeploymentWorkflows(BaseWorkflow):
 			result.add_error('Import file does not exist')
 			return result
 
+		return self._import_integration(
+			result,
+			lambda import_data: self.client.integrations.import_integration(
+				import_file_path, import_data
+			),
+			import_file_path,
+			import_plan,
+			overwrite_existing,
+		)
+
+	def import_integration_archive(
+		self,
+		archive: bytes,
+		file_name: str,
+		import_plan: Optional[Dict[str, Any]] = None,
+		overwrite_existing: bool = True,
+	) -> WorkflowResult:
+		"""
+		Import an integration from an archive in memory.
+
+		Args:
+		    archive: The integration archive.
+		    file_name: File name to upload the archive as.
+		    import_plan: Optional import plan with configuration options.
+		    overwrite_existing: Whether to overwrite existing integrations.
+
+		Returns:
+		    WorkflowResult: The workflow execution result.
+
+		"""
+		result = WorkflowResult()
+		result.message = f'Importing integration from {file_name}'
+
+		return self._import_integration(
+			result,
+			lambda import_data: self.client.integrations.import_archive(
+				archive, file_name, import_data
+			),
+			file_name,
+			import_plan,
+			overwrite_existing,
+		)
+
+	def _import_integration(
+		self,
+		result: WorkflowResult,
+		import_func: Callable[[Dict[str, Any]], Dict[str, Any]],
+		source: str,
+		import_plan: Optional[Dict[str, Any]],
+		overwrite_existing: bool,
+	) -> WorkflowResult:
+		"""
+		Import an integration and record it on a workflow result.
+
+		Args:
+		    result: The workflow result to update.
+		    import_func: Function importing the integration given the import data.
+		    source: File the integration is imported from, for messages.
+		    import_plan: Optional import plan with configuration options.
+		    overwrite_existing: Whether to overwrite existing integrations.
+
+		Returns:
+		    WorkflowResult: The workflow execution result.
+
+		"""
+		# Imports may change the connections of this environment
+		self._connection_details.clear()
+
 		# Prepare import data
 		import_data = {}
 
@@ -326,10 +416,8 @@ class DeploymentWorkflows(BaseWorkflow):
 
 		# Import the integration
 		try:
-			self.logger.info(f'Importing integration from {import_file_path}')
-			import_result = self.client.integrations.import_integration(
-				import_file_path, import_data
-			)
+			self.logger.info('Importing integration from %s', source)
+			import_result = import_func(import_data)
 
 			# Check import result
 			if not import_result:
@@ -366,10 +454,10 @@ class DeploymentWorkflows(BaseWorkflow):
 			result.message = f'Successfully imported integration {integration_name}'
 
 		except OICError as e:
-			self.logger.error(f'Failed to import integration: {e!s}')
+			self.logger.error('Failed to import integration: %s', e)
 			result.add_error('Failed to import integration', e)
 			result.success = False
-			result.message = f'Failed to import integration from {import_file_path}'
+			result.message = f'Failed to import integration from {source}'
 			return result
 
 		return result
@@ -404,59 +492,55 @@ class DeploymentWorkflows(BaseWorkflow):
 		result = WorkflowResult()
 		result.message = f'Promoting integration {integration_id} to target environment'
 
-		# Create a temporary directory for export files
-		import os
-		import tempfile
-		from datetime import datetime
-
-		temp_dir = tempfile.mkdtemp(prefix='oic_promotion_')
-		timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-		export_file_path = os.path.join(
-			temp_dir, f'integration_{integration_id}_{timestamp}.iar'
-		)
-
-		self.logger.info(f'Using temporary directory: {temp_dir}')
-		result.details['temp_directory'] = temp_dir
-
-		# Step 1: Export the integration from source environment
+		# Step 1: Export the integration archive from source environment. It is
+		# handed to the target in memory rather than through a temporary file.
 		self.logger.info(
-			f'Exporting integration {integration_id} from source environment'
-		)
-		export_result = self.export_integration(
-			integration_id=integration_id,
-			export_file_path=export_file_path,
-			include_dependencies=include_dependencies,
+			'Exporting integration %s from source environment', integration_id
 		)
-
-		# Check export result
-		if not export_result.success:
-			result.success = False
+		try:
+			integration = self.client.integrations.get(integration_id)
+			integration_name = integration.get('name', 'Unknown')
+			archive = self.client.integrations.export_archive(integration_id)
+		except OICError as e:
+			self.logger.error('Failed to export integration %s: %s', integration_id, e)
+			result.add_error(
+				'Failed to export integration from source environment',
+				e,
+				integration_id,
+			)
 			result.message = 'Failed to export integration from source environment'
-			result.merge(export_result)
 			return result
 
-		# Get integration name for better logging
-		integration_name = export_result.details.get('integration_name', 'Unknown')
 		result.details['integration_name'] = integration_name
 
+		# Dependencies are exported for the record only, they are not imported
+		if include_dependencies:
+			with tempfile.TemporaryDirectory(
+				prefix='oic_promotion_', **_TEMP_DIR_OPTIONS
+			) as temp_dir:
+				result.details['dependency_export'] = self._export_dependencies(
+					integration_id, integration_name, temp_dir
+				)
+
 		# Step 2: Prepare import plan if connection mapping is provided
 		import_plan = {}
 
 		if connection_map:
 			import_plan['connectionMap'] = connection_map
-			self.logger.info(f'Using connection mapping: {connection_map}')
+			self.logger.info('Using connection mapping: %s', connection_map)
 
 		# Step 3: Import the integration to target environment
 		self.logger.info(
-			f'Importing integration {integration_name} to target environment'
+			'Importing integration %s to target environment', integration_name
 		)
 
 		try:
 			# Create a new workflow for the target environment
 			target_workflow = DeploymentWorkflows(target_client)
 
-			import_result = target_workflow.import_integration(
-				import_file_path=export_file_path,
+			import_result = target_workflow.import_integration_archive(
+				archive=archive,
+				file_name=f'{integration_id.replace("|", "-")}.iar',
 				import_plan=import_plan,
 				overwrite_existing=True,
 			)
@@ -488,32 +572,36 @@ class DeploymentWorkflows(BaseWorkflow):
 			# Step 4: Activate the integration if requested
 			if activate_after_import and target_integration_id:
 				self.logger.info(
-					f'Activating integration {integration_name} in target environment'
+					'Activating integration %s in target environment', integration_name
 				)
 
 				try:
-					from oic_devops.workflows.integration import IntegrationWorkflows
-
-					target_integration_workflows = IntegrationWorkflows(target_client)
+					response = target_client.integrations.activate(
+						target_integration_id
+					)
 
-					activate_result = (
-						target_integration_workflows.bulk_activate_integrations(
-							integration_ids=[target_integration_id],
-							verify_activation=True,
-						)
+					# Skips polling when the response already reports the status
+					status = target_workflow._wait_for_integration_status(
+						target_integration_id,
+						'ACTIVATED',
+						_ACTIVATION_WAIT_TIME,
+						response,
 					)
 
-					if not activate_result.success:
+					if status != 'ACTIVATED':
+						result.add_error(
+							f'Activation verification failed for {integration_name}',
+							resource_id=target_integration_id,
+						)
 						result.success = False
 						result.message = 'Integration promoted but activation failed in target environment'
 						result.details['activation_status'] = 'failed'
-						result.merge(activate_result)
 					else:
 						result.details['activation_status'] = 'success'
 
 				except Exception as e:
 					self.logger.error(
-						f'Failed to activate integration in target environment: {e!s}'
+						'Failed to activate integration in target environment: %s', e
 					)
 					result.add_error(
 						'Failed to activate integration', e, target_integration_id
@@ -532,21 +620,12 @@ class DeploymentWorkflows(BaseWorkflow):
 					)
 
 		except Exception as e:
-			self.logger.error(f'Failed to promote integration: {e!s}')
+			self.logger.error('Failed to promote integration: %s', e)
 			result.add_error('Failed to promote integration', e)
 			result.success = False
 			result.message = f'Failed to promote integration {integration_name}'
 			return result
 
-		# Clean up temporary files
-		try:
-			import shutil
-
-			shutil.rmtree(temp_dir)
-			self.logger.info(f'Cleaned up temporary directory: {temp_dir}')
-		except Exception as e:
-			self.logger.warning(f'Failed to clean up temporary directory: {e!s}')
-
 		return result
 
 	def export_package(
@@ -582,9 +661,9 @@ class DeploymentWorkflows(BaseWorkflow):
 
 		# Ensure directory exists
 		export_dir = os.path.dirname(export_file_path)
-		if export_dir and not os.path.exists(export_dir):
+		if export_dir:
 			try:
-				os.makedirs(export_dir)
+				self._ensure_directory(export_dir)
 			except Exception as e:
 				result.success = False
 				result.message = f'Failed to create export directory {export_dir}'
@@ -657,6 +736,9 @@ class DeploymentWorkflows(BaseWorkflow):
 			result.add_error('Import file does not exist')
 			return result
 
+		# Imports may change the connections of this environment
+		self._connection_details.clear()
+
 		# Prepare import data
 		import_data = {}
 
@@ -714,9 +796,10 @@ class DeploymentWorkflows(BaseWorkflow):
 			'libraries',
 			'integrations',
 		],
-		exclude_filters: Optional[Dict[str, str]] = None,
-		include_filters: Optional[Dict[str, str]] = None,
+		exclude_filters: Optional[Dict[str, Union[str, List[str]]]] = None,
+		include_filters: Optional[Dict[str, Union[str, List[str]]]] = None,
 		activate_integrations: bool = False,
+		max_workers: int = 8,
 	) -> WorkflowResult:
 		"""
 		Clone resources from one environment to another.
@@ -728,9 +811,13 @@ class DeploymentWorkflows(BaseWorkflow):
 		Args:
 		    target_client: OICClient for the target environment.
 		    resource_types: Types of resources to clone.
-		    exclude_filters: Optional filters to exclude resources.
-		    include_filters: Optional filters to include resources.
+		    exclude_filters: Optional filters to exclude resources, by resource
+		        type. A filter is a string the resource name or ID contains, or a
+		        list of such strings of which any one matches.
+		    include_filters: Optional filters to include resources, in the same
+		        form as exclude_filters.
 		    activate_integrations: Whether to activate integrations after import.
+		    max_workers: Maximum number of resources to clone at once.
 
 		Returns:
 		    WorkflowResult: The workflow execution result.
@@ -739,170 +826,144 @@ class DeploymentWorkflows(BaseWorkflow):
 		result = WorkflowResult()
 		result.message = 'Cloning environment resources'
 
-		# Create a temporary directory for export files
-		import os
-		import tempfile
-		from datetime import datetime
-
-		temp_dir = tempfile.mkdtemp(prefix='oic_cloning_')
-		timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+		# Count clone outcomes by resource type and outcome
+		counts = Counter()
+
+		# Resources are handed from the source to the target in memory. Each
+		# export function takes a resource ID and returns its content, which
+		# the import function takes along with a file name to upload it as.
+		#
+		# Integrations can only be imported once the connections, lookups and
+		# libraries they use exist in the target, so they are cloned in a
+		# second stage. The types within a stage are cloned side by side.
+		stages = (
+			[rt for rt in resource_types if rt != 'integrations'],
+			[rt for rt in resource_types if rt == 'integrations'],
+		)
 
-		self.logger.info(f'Using temporary directory: {temp_dir}')
-		result.details['temp_directory'] = temp_dir
+		for stage in stages:
+			if not stage:
+				continue
 
-		# Initialize resource counters
-		resource_counters = {
-			'connections': {'exported': 0, 'imported': 0, 'failed': 0},
-			'lookups': {'exported': 0, 'imported': 0, 'failed': 0},
-			'libraries': {'exported': 0, 'imported': 0, 'failed': 0},
-			'integrations': {'exported': 0, 'imported': 0, 'failed': 0},
-			'activated': 0,
-		}
+			# Fetch the resource lists of the stage side by side, looking the
+			# filters up once per type rather than per resource
+			with ThreadPoolExecutor(
+				max_workers=min(len(stage), self.client.config.pool_maxsize)
+			) as executor:
+				listings = {
+					rt: executor.submit(
+						self._list_clones,
+						rt,
+						_resource_filter(
+							(exclude_filters or {}).get(rt),
+							(include_filters or {}).get(rt),
+						),
+					)
+					for rt in stage
+					if rt in _CLONE_EXTENSIONS
+				}
+				if 'connections' in listings:
+					target_connections = executor.submit(
+						self._index_connections, target_client
+					)
 
-		# Helper function to apply filters
-		def should_process_resource(resource, resource_type):
-			# Check exclude filters
-			if exclude_filters and resource_type in exclude_filters:
-				exclude_query = exclude_filters[resource_type]
-				# Simple string match for now - could be enhanced
-				if exclude_query in resource.get(
-					'name', ''
-				) or exclude_query in resource.get('id', ''):
-					return False
-
-			# Check include filters
-			if include_filters and resource_type in include_filters:
-				include_query = include_filters[resource_type]
-				# Simple string match for now - could be enhanced
-				if include_query not in resource.get(
-					'name', ''
-				) and include_query not in resource.get('id', ''):
-					return False
-
-			return True
-
-		# Process each resource type
-		for resource_type in resource_types:
-			resource_dir = os.path.join(temp_dir, resource_type)
-			os.makedirs(resource_dir, exist_ok=True)
+			clones = []
+			for resource_type in stage:
+				self.logger.info('Processing %s', resource_type)
 
-			self.logger.info(f'Processing {resource_type}')
+				extension = _CLONE_EXTENSIONS.get(resource_type)
+				if extension is None:
+					self.logger.warning('Unsupported resource type: %s', resource_type)
+					continue
 
-			try:
 				# Get list of resources
-				if resource_type == 'connections':
-					resources = self.client.connections.list()
-					export_func = lambda r_id, path: self._export_connection_as_json(
-						r_id, path
-					)
-					import_func = lambda path: self._import_connection_from_json(
-						path, target_client
-					)
-
-				elif resource_type == 'lookups':
-					resources = self.client.lookups.list()
-					export_func = lambda r_id, path: self.client.lookups.export(
-						r_id, path
-					)
-					import_func = lambda path: target_client.lookups.import_lookup(path)
+				try:
+					resources = listings[resource_type].result()
+				except OICError as e:
+					self.logger.error('Failed to get %s list: %s', resource_type, e)
+					result.add_error(f'Failed to get {resource_type} list', e)
+					continue
 
-				elif resource_type == 'libraries':
-					resources = self.client.libraries.list()
-					export_func = lambda r_id, path: self.client.libraries.export(
-						r_id, path
-					)
-					import_func = lambda path: target_client.libraries.import_library(
-						path
+				if resource_type == 'connections':
+					# Connections are cloned as their configuration
+					existing_connections = target_connections.result()
+					export_func = partial(self.client.connections.get, raw=True)
+					# Bind the index as a default, imports run after the loop moves on
+					import_func = (
+						lambda connection, file_name, existing=existing_connections: (
+							self._import_connection(connection, target_client, existing)
+						)
 					)
 
 				elif resource_type == 'integrations':
-					resources = self.client.integrations.list()
-					export_func = lambda r_id, path: self.client.integrations.export(
-						r_id, path
-					)
-					import_func = (
-						lambda path: target_client.integrations.import_integration(
-							path, {'overwrite': True}
-						)
+					export_func = self.client.integrations.export_archive
+					import_func = partial(
+						target_client.integrations.import_archive,
+						data={'overwrite': True},
 					)
 
 				else:
-					self.logger.warning(f'Unsupported resource type: {resource_type}')
-					continue
-
-				# Process each resource
-				for resource in resources:
-					resource_id = resource.get('id')
-					resource_name = resource.get('name', 'Unknown')
-
-					if not resource_id or not should_process_resource(
-						resource, resource_type
-					):
-						continue
-
-					# Export the resource
-					try:
-						export_path = os.path.join(
-							resource_dir,
-							f'{resource_type}_{resource_id}.{self._get_extension(resource_type)}',
-						)
-						self.logger.info(
-							f'Exporting {resource_type} {resource_name} to {export_path}'
-						)
-
-						export_func(resource_id, export_path)
-						resource_counters[resource_type]['exported'] += 1
+					export_func = getattr(self.client, resource_type).export_archive
+					import_func = getattr(target_client, resource_type).import_archive
+
+				clones.extend(
+					(
+						resource_type,
+						resource['id'],
+						resource.get('name', 'Unknown'),
+						f'{resource_type}_{resource["id"]}.{extension}',
+						export_func,
+						import_func,
+					)
+					for resource in resources
+				)
 
-						# Import the resource to target environment
-						try:
-							self.logger.info(
-								f'Importing {resource_type} {resource_name} to target environment'
-							)
-							import_result = import_func(export_path)
-
-							resource_counters[resource_type]['imported'] += 1
-
-							# Track imported integration IDs for activation if needed
-							if (
-								resource_type == 'integrations'
-								and activate_integrations
-							):
-								if import_result and 'id' in import_result:
-									# Keep track of imported integration ID
-									integration_id = import_result['id']
-
-									# Activate the integration
-									try:
-										target_client.integrations.activate(
-											integration_id
-										)
-										resource_counters['activated'] += 1
-										self.logger.info(
-											f'Activated integration {resource_name} in target environment'
-										)
-									except OICError as e:
-										self.logger.warning(
-											f'Failed to activate integration {resource_name}: {e!s}'
-										)
-
-						except Exception as e:
-							self.logger.error(
-								f'Failed to import {resource_type} {resource_name}: {e!s}'
-							)
-							resource_counters[resource_type]['failed'] += 1
+			if not clones:
+				continue
 
-					except Exception as e:
-						self.logger.error(
-							f'Failed to export {resource_type} {resource_name}: {e!s}'
-						)
-						resource_counters[resource_type]['failed'] += 1
+			# Export and import resources side by side, each one a few
+			# blocking REST calls
+			with ThreadPoolExecutor(
+				max_workers=min(
+					max_workers,
+					len(clones),
+					self.client.config.pool_maxsize,
+					target_client.config.pool_maxsize,
+				)
+			) as executor:
+				futures = {
+					executor.submit(
+						self._clone_resource,
+						resource_type,
+						resource_id,
+						resource_name,
+						file_name,
+						export_func,
+						import_func,
+						target_client,
+						activate_integrations,
+					): resource_type
+					for resource_type, resource_id, resource_name, file_name, export_func, import_func in clones
+				}
 
-			except OICError as e:
-				self.logger.error(f'Failed to get {resource_type} list: {e!s}')
-				result.add_error(f'Failed to get {resource_type} list', e)
-				continue
+				# Only this thread updates the counters, so no locking
+				for future in as_completed(futures):
+					exported, imported, activated = future.result()
+					resource_type = futures[future]
+					counts[resource_type, 'exported'] += exported
+					counts[resource_type, 'imported'] += imported
+					counts[resource_type, 'failed'] += not imported
+					counts[resource_type, 'activated'] += activated
 
 		# Update result with counters
+		resource_counters = {
+			resource_type: {
+				outcome: counts[resource_type, outcome]
+				for outcome in ('exported', 'imported', 'failed')
+			}
+			for resource_type in _CLONE_EXTENSIONS
+		}
+		resource_counters['activated'] = counts['integrations', 'activated']
 		result.details['resource_counters'] = resource_counters
 
 		# Build result message
@@ -912,10 +973,9 @@ class DeploymentWorkflows(BaseWorkflow):
 		total_failed = 0
 
 		for resource_type in resource_types:
-			counters = resource_counters[resource_type]
-			exported = counters['exported']
-			imported = counters['imported']
-			failed = counters['failed']
+			exported = counts[resource_type, 'exported']
+			imported = counts[resource_type, 'imported']
+			failed = counts[resource_type, 'failed']
 
 			total_exported += exported
 			total_imported += imported
@@ -938,83 +998,352 @@ class DeploymentWorkflows(BaseWorkflow):
 		else:
 			result.message = 'No resources were cloned'
 
-		# Clean up temporary files
+		return result
+
+	def _export_dependencies(
+		self,
+		integration_id: str,
+		integration_name: str,
+		dep_path: str,
+		max_workers: int = 8,
+		archive: bool = False,
+	) -> Dict[str, Any]:
+		"""
+		Export the connections, lookups and libraries an integration uses.
+
+		Failures are logged and reported rather than raised.
+
+		Args:
+		    integration_id: ID of the integration.
+		    integration_name: Name of the integration, for logging.
+		    dep_path: Directory, or tar archive if archive is True, to export
+		        the dependencies to.
+		    max_workers: Maximum number of dependencies to export at once.
+		    archive: Whether to write the dependencies to one uncompressed tar
+		        archive instead of a file each.
+
+		Returns:
+		    Dict: The dependency export status, location and counts.
+
+		"""
+		self.logger.info('Exporting dependencies for integration %s', integration_name)
+
+		# Find dependencies
+		try:
+			integration_workflows = IntegrationWorkflows(self.client)
+
+			dependency_result = integration_workflows.find_integration_dependencies(
+				integration_id=integration_id,
+				include_connections=True,
+				include_lookups=True,
+				include_libraries=True,
+			)
+
+			if not dependency_result.success:
+				self.logger.warning(
+					'Failed to find dependencies, continuing with export'
+				)
+				return {'status': 'failed', 'message': 'Failed to find dependencies'}
+
+			# Connections can only be exported as JSON configuration
+			fetchers = {
+				'connections': ('connection', 'json', self._get_connection_json),
+				'lookups': ('lookup', 'csv', self.client.lookups.export_archive),
+				'libraries': ('library', 'jar', self.client.libraries.export_archive),
+			}
+			dependencies = dependency_result.details.get('dependencies') or {}
+			exports = [
+				(
+					kind,
+					prefix,
+					dependency.get('name', 'Unknown'),
+					fetch,
+					dependency['id'],
+					f'{prefix}_{dependency["id"]}.{ext}',
+				)
+				for kind, (prefix, ext, fetch) in fetchers.items()
+				for dependency in dependencies.get(kind, ())
+				if dependency.get('id')
+			]
+
+			# Fetch each dependency, overlapping the REST calls. Only this
+			# thread writes the files and counts exports, so no locking.
+			dep_counts = dict.fromkeys(fetchers, 0)
+			with ExitStack() as stack:
+				if archive:
+					self._ensure_directory(os.path.dirname(dep_path) or '.')
+					archive_file = stack.enter_context(tarfile.open(dep_path, 'w'))
+				else:
+					self._ensure_directory(dep_path)
+					archive_file = None
+
+				if exports:
+					with ThreadPoolExecutor(
+						max_workers=min(
+							max_workers, len(exports), self.client.config.pool_maxsize
+						)
+					) as executor:
+						futures = {
+							executor.submit(fetch, dependency_id): (
+								kind,
+								prefix,
+								name,
+								file_name,
+							)
+							for kind, prefix, name, fetch, dependency_id, file_name in exports
+						}
+
+						for future in as_completed(futures):
+							kind, prefix, name, file_name = futures[future]
+							try:
+								self._write_dependency(
+									archive_file, dep_path, file_name, future.result()
+								)
+							except Exception as e:
+								self.logger.warning(
+									'Failed to export %s %s: %s', prefix, name, e
+								)
+								continue
+
+							dep_counts[kind] += 1
+							self.logger.info(
+								'Exported %s %s to %s/%s',
+								prefix,
+								name,
+								dep_path,
+								file_name,
+							)
+
+		except Exception as e:
+			self.logger.error('Failed to export dependencies: %s', e)
+			return {'status': 'failed', 'message': str(e)}
+
+		location = 'archive' if archive else 'directory'
+		return {'status': 'success', location: dep_path, 'counts': dep_counts}
+
+	def _write_dependency(
+		self,
+		archive_file: Optional[tarfile.TarFile],
+		dep_path: str,
+		file_name: str,
+		content: bytes,
+	) -> None:
+		"""
+		Write an exported dependency to a tar archive or a directory.
+
+		Args:
+		    archive_file: Open tar archive to add the dependency to, or None to
+		        write it to a file in dep_path.
+		    dep_path: The dependency export directory.
+		    file_name: File name of the dependency.
+		    content: The exported dependency.
+
+		"""
+		if archive_file is None:
+			with open(os.path.join(dep_path, file_name), 'wb') as f:
+				f.write(content)
+			return
+
+		member = tarfile.TarInfo(file_name)
+		member.size = len(content)
+		member.mtime = int(time.time())
+		archive_file.addfile(member, io.BytesIO(content))
+
+	def _clone_resource(
+		self,
+		resource_type: str,
+		resource_id: str,
+		resource_name: str,
+		file_name: str,
+		export_func: Callable[[str], Any],
+		import_func: Callable[[Any, str], Any],
+		target_client: OICClient,
+		activate_integrations: bool,
+	) -> Tuple[bool, bool, bool]:
+		"""
+		Export a resource and import it to the target environment.
+
+		Args:
+		    resource_type: Type of the resource.
+		    resource_id: ID of the resource.
+		    resource_name: Name of the resource, for logging.
+		    file_name: File name to import the resource as.
+		    export_func: Function taking a resource ID and returning its content.
+		    import_func: Function importing resource content under a file name.
+		    target_client: OICClient for the target environment.
+		    activate_integrations: Whether to activate integrations after import.
+
+		Returns:
+		    Tuple: Whether the resource was exported, imported and activated.
+
+		"""
+		# Export the resource
 		try:
-			import shutil
+			self.logger.info('Exporting %s %s', resource_type, resource_name)
+			content = export_func(resource_id)
+		except Exception as e:
+			self.logger.error(
+				'Failed to export %s %s: %s', resource_type, resource_name, e
+			)
+			return False, False, False
 
-			shutil.rmtree(temp_dir)
-			self.logger.info(f'Cleaned up temporary directory: {temp_dir}')
+		# Import the resource to target environment
+		try:
+			self.logger.info(
+				'Importing %s %s to target environment', resource_type, resource_name
+			)
+			import_result = import_func(content, file_name)
 		except Exception as e:
-			self.logger.warning(f'Failed to clean up temporary directory: {e!s}')
+			self.logger.error(
+				'Failed to import %s %s: %s', resource_type, resource_name, e
+			)
+			return True, False, False
 
-		return result
+		# Activate imported integrations if requested
+		if (
+			resource_type != 'integrations'
+			or not activate_integrations
+			or not import_result
+			or 'id' not in import_result
+		):
+			return True, True, False
+
+		try:
+			target_client.integrations.activate(import_result['id'])
+		except OICError as e:
+			self.logger.warning(
+				'Failed to activate integration %s: %s', resource_name, e
+			)
+			return True, True, False
 
-	def _export_connection_as_json(self, connection_id: str, file_path: str) -> str:
+		self.logger.info(
+			'Activated integration %s in target environment', resource_name
+		)
+		return True, True, True
+
+	def _ensure_directory(self, path: str) -> None:
+		"""
+		Create a directory if it does not exist yet.
+
+		Directories are only checked on disk the first time they are seen.
+
+		Args:
+		    path: Path of the directory.
+
+		"""
+		if path not in self._ensured_dirs:
+			os.makedirs(path, exist_ok=True)
+			self._ensured_dirs.add(path)
+
+	def _get_connection_json(self, connection_id: str) -> bytes:
 		"""
-		Export a connection as JSON since direct export is not supported.
+		Get a connection as an indented JSON document.
+
+		Connections are often shared by the integrations exported in a row, so
+		recently fetched connection details are reused.
 
 		Args:
-		    connection_id: ID of the connection to export.
-		    file_path: Path to save the exported connection file.
+		    connection_id: ID of the connection.
 
 		Returns:
-		    str: Path to the exported connection file.
+		    bytes: The connection JSON document.
 
 		"""
-		connection = self.client.connections.get(connection_id)
+		now = time.monotonic()
+		cached = self._connection_details.get(connection_id)
 
-		with open(file_path, 'w') as f:
-			json.dump(connection, f, indent=2)
+		if cached is not None and now - cached[0] < _CONNECTION_DETAILS_TTL:
+			connection = cached[1]
+		else:
+			connection = self.client.connections.get(connection_id, raw=True)
+			self._connection_details[connection_id] = (now, connection)
 
-		return file_path
+		return dumps_bytes(connection, pretty=True)
 
-	def _import_connection_from_json(
-		self, file_path: str, client: OICClient
-	) -> Dict[str, Any]:
+	def _list_clones(
+		self,
+		resource_type: str,
+		should_process_resource: Callable[[Dict[str, Any]], bool],
+	) -> List[Dict[str, Any]]:
 		"""
-		Import a connection from a JSON file.
+		List the resources of a type that pass the clone filters.
+
+		Resources that can be listed page by page are filtered as the pages
+		arrive rather than after the whole listing is collected.
 
 		Args:
-		    file_path: Path to the connection JSON file.
-		    client: OICClient for the target environment.
+		    resource_type: Type of the resources.
+		    should_process_resource: Predicate the resources must pass.
 
 		Returns:
-		    Dict: The import result.
+		    List[Dict]: The resources to clone.
 
 		"""
-		with open(file_path) as f:
-			connection = json.load(f)
+		resources = getattr(self.client, resource_type)
+		listing = getattr(resources, 'iter_all', resources.list)()
+		return [
+			resource
+			for resource in listing
+			if resource.get('id') and should_process_resource(resource)
+		]
+
+	def _index_connections(
+		self, client: OICClient
+	) -> Optional[Dict[str, Dict[str, Any]]]:
+		"""
+		Get the connections of an environment by identifier.
 
-		# Check if connection already exists
-		try:
-			existing_connections = client.connections.list()
-			for existing in existing_connections:
-				if existing.get('identifier') == connection.get('identifier'):
-					# Update existing connection
-					return client.connections.update(existing['id'], connection)
-		except:
-			pass
+		Args:
+		    client: OICClient for the environment.
 
-		# Create new connection
-		return client.connections.create(connection)
+		Returns:
+		    Optional[Dict]: The connections keyed by identifier, or None if they
+		        could not be listed.
+
+		"""
+		try:
+			return {
+				connection['identifier']: connection
+				for connection in client.connections.iter_all()
+				if connection.get('identifier')
+			}
+		except OICError as e:
+			self.logger.warning(
+				'Failed to list target connections, checking each connection individually: %s',
+				e,
+			)
+			return None
 
-	def _get_extension(self, resource_type: str) -> str:
+	def _import_connection(
+		self,
+		connection: Dict[str, Any],
+		client: OICClient,
+		existing_connections: Optional[Dict[str, Dict[str, Any]]],
+	) -> Dict[str, Any]:
 		"""
-		Get the file extension for a resource type.
+		Import a connection configuration, updating it if it already exists.
 
 		Args:
-		    resource_type: Type of resource.
+		    connection: The connection configuration.
+		    client: OICClient for the target environment.
+		    existing_connections: The target connections keyed by identifier,
+		        or None to look each connection up by its identifier.
 
 		Returns:
-		    str: File extension for the resource type.
-
-		"""
-		if resource_type == 'connections':
-			return 'json'
-		if resource_type == 'lookups':
-			return 'csv'
-		if resource_type == 'libraries':
-			return 'jar'
-		if resource_type == 'integrations':
-			return 'iar'
-		return 'bin'
+		    Dict: The import result.
+
+		"""
+		identifier = connection.get('identifier')
+		existing = None
+		if identifier:
+			if existing_connections is not None:
+				existing = existing_connections.get(identifier)
+			else:
+				existing = client.connections.get_by_identifier(identifier)
+
+		if existing is not None and 'id' in existing:
+			# Update existing connection
+			return client.connections.update(existing['id'], connection)
+
+		# Create new connection
+		return client.connections.create(connection)
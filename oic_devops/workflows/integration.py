@@ -21,6 +21,16 @@ class IntegrationWorkflows(BaseWorkflow):
 	schedule management.
 	"""
 
+	# Method names for the operations accepted by execute
+	_OPERATIONS = {
+		'bulk_activate': 'bulk_activate_integrations',
+		'bulk_deactivate': 'bulk_deactivate_integrations',
+		'manage_schedules': 'manage_integration_schedules',
+		'find_dependencies': 'find_integration_dependencies',
+		'restart': 'restart_integration',
+		'trace_instances': 'trace_integration_instances',
+	}
+
 	def execute(self, *args, **kwargs) -> WorkflowResult:
 		"""
 		Execute the specified integration workflow.
@@ -38,18 +48,10 @@ class IntegrationWorkflows(BaseWorkflow):
 		"""
 		operation = kwargs.pop('operation', None)
 
-		if operation == 'bulk_activate':
-			return self.bulk_activate_integrations(**kwargs)
-		if operation == 'bulk_deactivate':
-			return self.bulk_deactivate_integrations(**kwargs)
-		if operation == 'manage_schedules':
-			return self.manage_integration_schedules(**kwargs)
-		if operation == 'find_dependencies':
-			return self.find_integration_dependencies(**kwargs)
-		if operation == 'restart':
-			return self.restart_integration(**kwargs)
-		if operation == 'trace_instances':
-			return self.trace_integration_instances(**kwargs)
+		method_name = self._OPERATIONS.get(operation)
+		if method_name is not None:
+			return getattr(self, method_name)(**kwargs)
+
 		result = WorkflowResult(
 			success=False,
 			message=f'Unknown integration workflow operation: {operation}',
@@ -195,33 +197,22 @@ class IntegrationWorkflows(BaseWorkflow):
 			# Activate the integration
 			try:
 				self.logger.info(f'Activating integration: {integration_name}')
-				self.client.integrations.activate(integration_id)
+				response = self.client.integrations.activate(integration_id)
 
 				# Verify activation if requested
 				activation_verified = True
 				if verify_activation:
-					# Wait a moment before checking
-					if sequential:
-						self.logger.info(
-							f'Waiting {wait_time}s for activation to complete'
-						)
-						time.sleep(wait_time)
-
-					# Check activation status
-					try:
-						integration_status = self.client.integrations.get(
-							integration_id
-						)
-						new_status = integration_status.get('status')
+					# Poll for up to wait_time when sequential, otherwise check once
+					new_status = self._wait_for_integration_status(
+						integration_id,
+						'ACTIVATED',
+						wait_time if sequential else 0,
+						response,
+					)
 
-						if new_status != 'ACTIVATED':
-							self.logger.warning(
-								f'Integration {integration_name} not fully activated, status: {new_status}'
-							)
-							activation_verified = False
-					except OICError as e:
-						self.logger.error(
-							f'Failed to verify activation of integration {integration_name}: {e!s}'
+					if new_status != 'ACTIVATED':
+						self.logger.warning(
+							f'Integration {integration_name} not fully activated, status: {new_status}'
 						)
 						activation_verified = False
 
@@ -272,9 +263,11 @@ class IntegrationWorkflows(BaseWorkflow):
 						)
 						break
 
-				# Wait between activations if sequential
+				# Wait between activations if sequential and not already verified
 				if (
-					sequential and integration != integrations_to_activate[-1]
+					sequential
+					and not verify_activation
+					and integration != integrations_to_activate[-1]
 				):  # Not the last one
 					self.logger.info(f'Waiting {wait_time}s before next activation')
 					time.sleep(wait_time)
@@ -464,33 +457,27 @@ class IntegrationWorkflows(BaseWorkflow):
 			# Deactivate the integration
 			try:
 				self.logger.info(f'Deactivating integration: {integration_name}')
-				self.client.integrations.deactivate(integration_id)
+				response = self.client.integrations.deactivate(integration_id)
 
 				# Verify deactivation if requested
 				deactivation_verified = True
 				if verify_deactivation:
-					# Wait a moment before checking
-					if sequential:
-						self.logger.info(
-							f'Waiting {wait_time}s for deactivation to complete'
-						)
-						time.sleep(wait_time)
-
-					# Check deactivation status
-					try:
-						integration_status = self.client.integrations.get(
-							integration_id
-						)
-						new_status = integration_status.get('status')
+					# Poll for up to wait_time when sequential, otherwise check once
+					new_status = self._wait_for_integration_status(
+						integration_id,
+						'CONFIGURED',
+						wait_time if sequential else 0,
+						response,
+					)
 
-						if new_status == 'ACTIVATED':
-							self.logger.warning(
-								f'Integration {integration_name} still activated, deactivation failed'
-							)
-							deactivation_verified = False
-					except OICError as e:
+					if new_status is None:
 						self.logger.error(
-							f'Failed to verify deactivation of integration {integration_name}: {e!s}'
+							f'Failed to verify deactivation of integration {integration_name}'
+						)
+						deactivation_verified = False
+					elif new_status == 'ACTIVATED':
+						self.logger.warning(
+							f'Integration {integration_name} still activated, deactivation failed'
 						)
 						deactivation_verified = False
 
@@ -541,9 +528,11 @@ class IntegrationWorkflows(BaseWorkflow):
 						)
 						break
 
-				# Wait between deactivations if sequential
+				# Wait between deactivations if sequential and not already verified
 				if (
-					sequential and integration != integrations_to_deactivate[-1]
+					sequential
+					and not verify_deactivation
+					and integration != integrations_to_deactivate[-1]
 				):  # Not the last one
 					self.logger.info(f'Waiting {wait_time}s before next deactivation')
 					time.sleep(wait_time)
@@ -951,6 +940,8 @@ class IntegrationWorkflows(BaseWorkflow):
 		# Some OIC versions store connection information differently
 		# Check invoke/trigger sections if they exist
 		if include_connections:
+			seen_connections = {conn['id'] for conn in connections}
+
 			for section in ['triggers', 'invokes']:
 				if section in integration and isinstance(integration[section], list):
 					for item in integration[section]:
@@ -962,7 +953,8 @@ class IntegrationWorkflows(BaseWorkflow):
 
 						if conn_id:
 							# Check if we already have this connection
-							if not any(conn['id'] == conn_id for conn in connections):
+							if conn_id not in seen_connections:
+								seen_connections.add(conn_id)
 								connections.append({'id': conn_id, 'name': conn_name})
 								result.add_resource(
 									'connection', conn_id, {'name': conn_name}
@@ -1051,39 +1043,37 @@ class IntegrationWorkflows(BaseWorkflow):
 		if current_status == 'ACTIVATED':
 			try:
 				self.logger.info(f'Deactivating integration: {integration_name}')
-				self.client.integrations.deactivate(integration_id)
+				response = self.client.integrations.deactivate(integration_id)
 
-				# Wait for deactivation to complete
-				self.logger.info(f'Waiting {wait_time}s for deactivation to complete')
-				time.sleep(wait_time)
+				# Wait for deactivation to complete, up to wait_time
+				self.logger.info(
+					f'Waiting up to {wait_time}s for deactivation to complete'
+				)
+				new_status = self._wait_for_integration_status(
+					integration_id, 'CONFIGURED', wait_time, response
+				)
 
 				# Verify deactivation if requested
-				if verify_restart:
-					try:
-						integration_status = self.client.integrations.get(
-							integration_id
-						)
-						if integration_status.get('status') == 'ACTIVATED':
-							self.logger.warning(
-								f'Integration {integration_name} still activated after deactivation attempt'
-							)
-							result.add_error(
-								'Deactivation verification failed',
-								resource_id=integration_id,
-							)
-							result.success = False
-							result.message = (
-								f'Failed to deactivate integration {integration_name}'
-							)
-							return result
-					except OICError as e:
-						self.logger.error(f'Failed to verify deactivation: {e!s}')
-						result.add_error(
-							'Failed to verify deactivation', e, integration_id
-						)
-						result.success = False
-						result.message = f'Failed to verify deactivation of integration {integration_name}'
-						return result
+				if verify_restart and new_status is None:
+					self.logger.error('Failed to verify deactivation')
+					result.add_error(
+						'Failed to verify deactivation', resource_id=integration_id
+					)
+					result.success = False
+					result.message = f'Failed to verify deactivation of integration {integration_name}'
+					return result
+				if verify_restart and new_status == 'ACTIVATED':
+					self.logger.warning(
+						f'Integration {integration_name} still activated after deactivation attempt'
+					)
+					result.add_error(
+						'Deactivation verification failed', resource_id=integration_id
+					)
+					result.success = False
+					result.message = (
+						f'Failed to deactivate integration {integration_name}'
+					)
+					return result
 
 			except OICError as e:
 				self.logger.error(
@@ -1097,43 +1087,43 @@ class IntegrationWorkflows(BaseWorkflow):
 		# Activate the integration
 		try:
 			self.logger.info(f'Activating integration: {integration_name}')
-			self.client.integrations.activate(integration_id)
+			response = self.client.integrations.activate(integration_id)
 
-			# Wait for activation to complete
-			self.logger.info(f'Waiting {wait_time}s for activation to complete')
-			time.sleep(wait_time)
+			# Wait for activation to complete, up to wait_time
+			self.logger.info(f'Waiting up to {wait_time}s for activation to complete')
+			final_status = self._wait_for_integration_status(
+				integration_id, 'ACTIVATED', wait_time, response
+			)
 
 			# Verify activation if requested
 			if verify_restart:
-				try:
-					integration_status = self.client.integrations.get(integration_id)
-					final_status = integration_status.get('status')
-
-					result.details['final_status'] = final_status
-					result.add_resource(
-						'integration', integration_id, {'final_status': final_status}
+				if final_status is None:
+					self.logger.error('Failed to verify activation')
+					result.add_error(
+						'Failed to verify activation', resource_id=integration_id
 					)
-
-					if final_status != 'ACTIVATED':
-						self.logger.warning(
-							f'Integration {integration_name} not fully activated, status: {final_status}'
-						)
-						result.add_error(
-							'Activation verification failed', resource_id=integration_id
-						)
-						result.success = False
-						result.message = f'Failed to activate integration {integration_name}, final status: {final_status}'
-						return result
-
-				except OICError as e:
-					self.logger.error(f'Failed to verify activation: {e!s}')
-					result.add_error('Failed to verify activation', e, integration_id)
 					result.success = False
 					result.message = (
 						f'Failed to verify activation of integration {integration_name}'
 					)
 					return result
 
+				result.details['final_status'] = final_status
+				result.add_resource(
+					'integration', integration_id, {'final_status': final_status}
+				)
+
+				if final_status != 'ACTIVATED':
+					self.logger.warning(
+						f'Integration {integration_name} not fully activated, status: {final_status}'
+					)
+					result.add_error(
+						'Activation verification failed', resource_id=integration_id
+					)
+					result.success = False
+					result.message = f'Failed to activate integration {integration_name}, final status: {final_status}'
+					return result
+
 		except OICError as e:
 			self.logger.error(
 				f'Failed to activate integration {integration_name}: {e!s}'
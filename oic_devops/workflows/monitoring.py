@@ -23,6 +23,15 @@ class MonitoringWorkflows(BaseWorkflow):
 	including error tracking, performance metrics, and health checks.
 	"""
 
+	# Method names for the operations accepted by execute
+	_OPERATIONS = {
+		'health_check': 'perform_health_check',
+		'error_analysis': 'analyze_errors',
+		'performance_metrics': 'collect_performance_metrics',
+		'purge_instances': 'purge_integration_instances',
+		'generate_report': 'generate_monitoring_report',
+	}
+
 	def execute(self, *args, **kwargs) -> WorkflowResult:
 		"""
 		Execute the specified monitoring workflow.
@@ -40,16 +49,10 @@ class MonitoringWorkflows(BaseWorkflow):
 		"""
 		operation = kwargs.pop('operation', None)
 
-		if operation == 'health_check':
-			return self.perform_health_check(**kwargs)
-		if operation == 'error_analysis':
-			return self.analyze_errors(**kwargs)
-		if operation == 'performance_metrics':
-			return self.collect_performance_metrics(**kwargs)
-		if operation == 'purge_instances':
-			return self.purge_integration_instances(**kwargs)
-		if operation == 'generate_report':
-			return self.generate_monitoring_report(**kwargs)
+		method_name = self._OPERATIONS.get(operation)
+		if method_name is not None:
+			return getattr(self, method_name)(**kwargs)
+
 		result = WorkflowResult(
 			success=False, message=f'Unknown monitoring workflow operation: {operation}'
 		)
@@ -22,6 +22,15 @@ class ScheduleWorkflows(BaseWorkflow):
 	such as batch updates, schedule tracking, and schedule imports/exports.
 	"""
 
+	# Method names for the operations accepted by execute
+	_OPERATIONS = {
+		'update_schedules': 'update_integration_schedules',
+		'export_schedules': 'export_integration_schedules',
+		'import_schedules': 'import_integration_schedules',
+		'validate_schedules': 'validate_integration_schedules',
+		'list_schedules': 'list_integration_schedules',
+	}
+
 	def execute(self, *args, **kwargs) -> WorkflowResult:
 		"""
 		Execute the specified schedule workflow.
@@ -39,16 +48,10 @@ class ScheduleWorkflows(BaseWorkflow):
 		"""
 		operation = kwargs.pop('operation', None)
 
-		if operation == 'update_schedules':
-			return self.update_integration_schedules(**kwargs)
-		if operation == 'export_schedules':
-			return self.export_integration_schedules(**kwargs)
-		if operation == 'import_schedules':
-			return self.import_integration_schedules(**kwargs)
-		if operation == 'validate_schedules':
-			return self.validate_integration_schedules(**kwargs)
-		if operation == 'list_schedules':
-			return self.list_integration_schedules(**kwargs)
+		method_name = self._OPERATIONS.get(operation)
+		if method_name is not None:
+			return getattr(self, method_name)(**kwargs)
+
 		result = WorkflowResult(
 			success=False, message=f'Unknown schedule workflow operation: {operation}'
 		)
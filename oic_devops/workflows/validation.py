@@ -21,6 +21,15 @@ class ValidationWorkflows(BaseWorkflow):
 	including connection validation, integration validation, and best practices.
 	"""
 
+	# Method names for the operations accepted by execute
+	_OPERATIONS = {
+		'validate_connections': 'validate_connections',
+		'validate_integrations': 'validate_integrations',
+		'best_practices': 'validate_best_practices',
+		'configuration_check': 'validate_configuration',
+		'naming_conventions': 'validate_naming_conventions',
+	}
+
 	def execute(self, *args, **kwargs) -> WorkflowResult:
 		"""
 		Execute the specified validation workflow.
@@ -38,16 +47,10 @@ class ValidationWorkflows(BaseWorkflow):
 		"""
 		operation = kwargs.pop('operation', None)
 
-		if operation == 'validate_connections':
-			return self.validate_connections(**kwargs)
-		if operation == 'validate_integrations':
-			return self.validate_integrations(**kwargs)
-		if operation == 'best_practices':
-			return self.validate_best_practices(**kwargs)
-		if operation == 'configuration_check':
-			return self.validate_configuration(**kwargs)
-		if operation == 'naming_conventions':
-			return self.validate_naming_conventions(**kwargs)
+		method_name = self._OPERATIONS.get(operation)
+		if method_name is not None:
+			return getattr(self, method_name)(**kwargs)
+
 		result = WorkflowResult(
 			success=False, message=f'Unknown validation workflow operation: {operation}'
 		)
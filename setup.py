@@ -31,6 +31,7 @@ setup(
 		'python-dateutil>=2.8.1',
 		'jsonschema>=3.2.0',
 	],
+	extras_require={'speedups': ['orjson>=3.6.0']},
 	entry_points={'console_scripts': ['oic-devops=oic_devops.cli:main']},
 	include_package_data=True,
 	package_data={'oic_devops': ['config-template.yaml']},
@@ -0,0 +1,103 @@
+"""Tests for the backup workflows."""
+
+import json
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from oic_devops.exceptions import OICValidationError
+from oic_devops.resources.connections import ConnectionsResource
+from oic_devops.workflows.backup import BackupWorkflows
+
+CONNECTIONS_PATH = '/ic/api/integration/v1/connections'
+
+CONNECTIONS = {
+	'CONN_A': {
+		'id': 'CONN_A',
+		'name': 'Connection A',
+		'connectionType': 'REST',
+		'lockedFlag': False,
+		'lastUpdatedBy': 'user',
+		'createdBy': 'user',
+		'securityProperties': {'username': 'api', 'password': 'secret'},
+	},
+	'CONN_B': {
+		'id': 'CONN_B',
+		'name': 'Connection B',
+		'connectionType': 'SOAP',
+		'lockedFlag': False,
+		'lastUpdatedBy': 'user',
+		'createdBy': 'user',
+	},
+}
+
+
+class FakeClient:
+	"""Serve the connections endpoints from memory."""
+
+	def __init__(self):
+		self.config = SimpleNamespace(pool_maxsize=4)
+		self.connections = ConnectionsResource(self)
+
+	def get(self, endpoint, params=None):
+		if endpoint == CONNECTIONS_PATH:
+			return [
+				{key: connection[key] for key in ('id', 'name', 'connectionType')}
+				for connection in CONNECTIONS.values()
+			]
+
+		return json.loads(json.dumps(CONNECTIONS[endpoint.rsplit('/', 1)[1]]))
+
+
+def test_backup_connections_writes_raw_details(tmp_path):
+	result = BackupWorkflows(FakeClient()).backup_connections(
+		str(tmp_path), compress=False
+	)
+
+	assert result.success
+	for connection_id, connection in CONNECTIONS.items():
+		backup_file = Path(result.resources['connection'][connection_id]['backup_file'])
+		details = json.loads(backup_file.read_text())
+		assert details['id'] == connection_id
+		assert details['name'] == connection['name']
+
+	backup_file = result.resources['connection']['CONN_A']['backup_file']
+	details = json.loads(Path(backup_file).read_text())
+	assert details['securityProperties'] == {
+		'username': 'api',
+		'password': '**REDACTED**',
+	}
+
+
+def test_extract_backup_writes_members_under_target(tmp_path):
+	archive_path = tmp_path / 'backup.zip'
+	with zipfile.ZipFile(archive_path, 'w') as archive:
+		archive.writestr('connections/', '')
+		archive.writestr('connections/CONN_A.json', '{}')
+		archive.writestr('backup_metadata.json', '{}')
+
+	target = tmp_path / 'target'
+	target.mkdir()
+	BackupWorkflows(FakeClient())._extract_backup(str(archive_path), str(target))
+
+	assert (target / 'connections' / 'CONN_A.json').read_text() == '{}'
+	assert (target / 'backup_metadata.json').read_text() == '{}'
+
+
+@pytest.mark.parametrize('member', ['../escaped_dir/x.json', '/tmp/escaped_dir/x.json'])
+def test_extract_backup_rejects_members_outside_target(tmp_path, member):
+	archive_path = tmp_path / 'backup.zip'
+	with zipfile.ZipFile(archive_path, 'w') as archive:
+		archive.writestr('connections/CONN_A.json', '{}')
+		archive.writestr(member, '{}')
+
+	target = tmp_path / 'target'
+	target.mkdir()
+	with pytest.raises(OICValidationError):
+		BackupWorkflows(FakeClient())._extract_backup(str(archive_path), str(target))
+
+	assert not (tmp_path / 'escaped_dir').exists()
+	assert not Path('/tmp/escaped_dir').exists()
+	assert not any(target.iterdir())
@@ -0,0 +1,54 @@
+"""Tests for the connection workflows."""
+
+from types import SimpleNamespace
+
+from oic_devops.resources.integrations import IntegrationsResource
+from oic_devops.workflows.connection import ConnectionWorkflows
+
+INTEGRATIONS = [
+	{
+		'id': 'I1|01.00.0000',
+		'name': 'I1',
+		'status': 'ACTIVATED',
+		'pattern': 'Orchestration',
+		'version': '01.00.0000',
+		'endPoints': [{'connection': {'id': 'C1'}}, {'connection': {'id': 'C2'}}],
+	},
+	{
+		'id': 'I2|01.00.0000',
+		'name': 'I2',
+		'status': 'CONFIGURED',
+		'pattern': 'Scheduled',
+		'version': '01.00.0000',
+		'endPoints': [{'connection': {'id': 'C2'}}],
+	},
+]
+
+
+class FakeIntegrations(IntegrationsResource):
+	"""Serve the integrations listing from memory."""
+
+	def list_all(self, params=None):
+		return [dict(integration) for integration in INTEGRATIONS]
+
+
+def make_workflows():
+	client = SimpleNamespace(config=SimpleNamespace(pool_maxsize=4))
+	client.integrations = FakeIntegrations(client)
+	return ConnectionWorkflows(client)
+
+
+def test_find_dependent_integrations_returns_only_that_connection():
+	workflows = make_workflows()
+
+	for connection_id, integration_ids in (
+		('C1', ['I1|01.00.0000']),
+		('C2', ['I1|01.00.0000', 'I2|01.00.0000']),
+		('C3', []),
+	):
+		result = workflows.find_dependent_integrations(connection_id)
+
+		assert result.success
+		dependents = result.resources['connection'][connection_id]
+		assert (dependents['connection_id'] == connection_id).all()
+		assert sorted(dependents['integration_id']) == integration_ids